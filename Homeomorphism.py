@@ -2,13 +2,20 @@ from manim import *
 import random
 
 from QualityMathVis_Utils import ArrowDoubleEnded3D, CoffeeMug
+from animations import Recolor
+from geometry_cache import TexCacheMixin, cached_curve
+from hilbert import hilbert_curve_points
+from mobjects import GlyphDecimalNumber, TubePath, chunk_layout
+from parametric import VectorizedParametricFunction
+from tex_batch import TexFuture
+from updaters import bind_position, bind_style, updater_scheduler
 
 BACKGROUND_COLOR = BLUE
 FOREGROUND_COLOR = BLUE_C
 RESOLUTION = 25
 
 
-class DonutToCoffeeScene(ThreeDScene):
+class DonutToCoffeeScene(TexCacheMixin, ThreeDScene):
     def construct(self):
         self.set_camera_orientation(phi=75 * DEGREES, theta=45 * DEGREES)
         self.begin_ambient_camera_rotation(rate=0.15)
@@ -33,7 +40,7 @@ class DonutToCoffeeScene(ThreeDScene):
         self.play(FadeOut(torus1))
 
 
-class ScribbleInBoxScene(ZoomedScene):
+class ScribbleInBoxScene(TexCacheMixin, ZoomedScene):
     def construct(self):
         # Create NumberPlane as background
         plane = NumberPlane(
@@ -71,32 +78,29 @@ class ScribbleInBoxScene(ZoomedScene):
             choice.append(random_vals[random.randint(0, num_calls - 1)])
 
         # Define parametric function for nearly space filling curve
+        choice = np.array(choice)
+
         def space_filling_curve(t):
-            j = int(t / step_size)
-            y = choice[j]
-            if t < 0.5:
-                x = (4.4 * t) - 2
-            elif 0.5 <= t <= 0.52:
-                x = (4 * (t - 0.02 + (0.02 * ((t - 0.5) / 0.02))) - 2)
-                y = 0.02 * choice[j]
-            else:
-                x = 4 * t - 2
-            return x * RIGHT + y * UP
+            j = (np.asarray(t) / step_size).astype(int)
+            middle = (0.5 <= t) & (t <= 0.52)
+            y = np.where(middle, 0.02 * choice[j], choice[j])
+            x = np.where(t < 0.5, (4.4 * t) - 2,
+                         np.where(middle, (4 * (t - 0.02 + (0.02 * ((t - 0.5) / 0.02))) - 2), 4 * t - 2))
+            return np.expand_dims(x, -1) * RIGHT + np.expand_dims(y, -1) * UP
 
         t_param = ValueTracker(0)
         # Create nearly space filling curve
-        curve = always_redraw(lambda:
-                              ParametricFunction(space_filling_curve,
-                                                 t_range=(0, 1, step_size),
-                                                 color=MAROON,
-                                                 stroke_width=3 - 2.6 * t_param.get_value())
-                              )
-
-        middle_part = ParametricFunction(space_filling_curve,
-                                         t_range=(0.5, 0.52, step_size),
-                                         color=GOLD,
-                                         stroke_width=3 - 2.3 * 1,
-                                         z_index=2)
+        curve = VectorizedParametricFunction(space_filling_curve,
+                                             t_range=(0, 1, step_size),
+                                             color=MAROON,
+                                             stroke_width=3)
+        bind_style(curve, t_param, stroke_width=lambda t: 3 - 2.6 * t)
+
+        middle_part = VectorizedParametricFunction(space_filling_curve,
+                                                   t_range=(0.5, 0.52, step_size),
+                                                   color=GOLD,
+                                                   stroke_width=3 - 2.3 * 1,
+                                                   z_index=2)
 
         self.play(Create(curve), run_time=4)
 
@@ -107,7 +111,7 @@ class ScribbleInBoxScene(ZoomedScene):
         self.wait(3.5)
 
 
-class BriefOverviewScene(Scene):
+class BriefOverviewScene(TexCacheMixin, Scene):
     def construct(self):
         leading_question = VGroup(Tex(r'1. Can a ', r'continuous', r' function', r' from ',
                                       r'$\mathbb R \to \mathbb R^2$'), Tex(r' be ', r' onto', r' and ', r'one-to-one?')) \
@@ -150,7 +154,7 @@ class BriefOverviewScene(Scene):
         self.wait()
 
 
-class FunctionExamplesScene(Scene):
+class FunctionExamplesScene(TexCacheMixin, Scene):
     def construct(self):
         poly = MathTex(r'f(x) = x^2 + 1').scale(1.2).to_edge(UP, buff=1.5)
         self.play(Write(poly), run_time=1)
@@ -196,33 +200,28 @@ class FunctionExamplesScene(Scene):
         in_line = NumberLine(x_range=np.array([0, 1]), length=4, tip_length=0.4).shift(LEFT * 3.5)
 
         def spiral(t):
-            pt = axes.c2p(t * np.cos(4 * PI * t), t * t * np.sin(4 * PI * t))
-            return np.array((pt[0], pt[1], 0))
+            return axes.c2p(t * np.cos(4 * PI * t), t * t * np.sin(4 * PI * t))
 
-        spiral_curve = ParametricFunction(spiral, t_range=np.array([0, 1]),
-                                          fill_opacity=0,
-                                          color=ORANGE,
-                                          stroke_opacity=0.9)
-        follow_dot = always_redraw(lambda: Dot(spiral_curve.get_end(), color=MAROON))
+        spiral_curve = VectorizedParametricFunction(spiral, t_range=np.array([0, 1]),
+                                                    fill_opacity=0,
+                                                    color=ORANGE,
+                                                    stroke_opacity=0.9)
+        follow_dot = updater_scheduler.redraw(lambda: Dot(spiral_curve.get_end(), color=MAROON),
+                                            spiral_curve.get_end)
 
         self.play(TransformFromCopy(fin_title[1], in_line))
         self.play(TransformFromCopy(fin_title[3], axes))
         in_line = NumberLine(x_range=np.array([0, 1]), length=4, tip_length=0.4, include_numbers=True).shift(LEFT * 3.5)
 
         tracker = ValueTracker(0)
-        dot = always_redraw(lambda:
-                            Dot(in_line.n2p(tracker.get_value()),
-                                color=MAROON,
-                                radius=0.1,
-                                fill_opacity=1)
-                            )
-        arrow = always_redraw(lambda:
-                              Arrow(start=UP, end=DOWN).next_to(dot, UP).set_color([ORANGE, MAROON])
-                              )
-        number = DecimalNumber(0, color=ORANGE).next_to(arrow, UP)
-
-        number.add_updater(lambda m: m.next_to(arrow, UP))
-        number.add_updater(lambda m: m.set_value(in_line.p2n(dot.get_center())))
+        dot = bind_position(Dot(color=MAROON, radius=0.1, fill_opacity=1), tracker, in_line.n2p)
+        arrow = updater_scheduler.redraw(lambda:
+                                         Arrow(start=UP, end=DOWN).next_to(dot, UP).set_color([ORANGE, MAROON]),
+                                         dot.get_center)
+        number = GlyphDecimalNumber(0, color=ORANGE).next_to(arrow, UP)
+
+        updater_scheduler.add_updater(number, lambda m: m.next_to(arrow, UP), arrow.get_center)
+        updater_scheduler.add_updater(number, lambda m: m.set_value(in_line.p2n(dot.get_center())), dot.get_center)
 
         function_equation = MathTex(r'f', r'(t) = (', r't \cos(4 \pi t), \,', r't^2\sin(4 \pi t)', ')', color=BLUE_A)
         function_equation.next_to(in_line, DOWN, buff=1.5)
@@ -242,8 +241,7 @@ class FunctionExamplesScene(Scene):
         def continuous_func(t):
             x = 2 * np.sin(1.3 * TAU * t)
             y = 2 * np.sin(1.4 * TAU * t) * np.sin(2 * TAU * t)
-            pt = axes.c2p(x, y)
-            return np.array((pt[0], pt[1], 0))
+            return axes.c2p(x, y)
 
         random.seed(10)
         random_inputs = [random.random() for _ in range(200)]
@@ -261,12 +259,12 @@ class FunctionExamplesScene(Scene):
             self.play(FadeIn(dots[i]), run_time=0.01)
 
         tracker.set_value(0)
-        curve = ParametricFunction(continuous_func, t_range=(0, 1), color=ORANGE)
+        curve = VectorizedParametricFunction(continuous_func, t_range=(0, 1), color=ORANGE)
         self.play(Create(curve), tracker.animate.set_value(1), run_time=4)
         self.wait(2)
 
 
-class TopologicalContinuityScene(ThreeDScene):
+class TopologicalContinuityScene(TexCacheMixin, ThreeDScene):
     def construct(self):
         def path_on_sphere_1(t):
             x = 1.095 * np.cos(t)
@@ -321,10 +319,9 @@ class TopologicalContinuityScene(ThreeDScene):
         )
         axes.next_to(real_func_example, DOWN).shift(RIGHT * 3)
 
-        trace = ParametricFunction(lambda t: axes.c2p(np.array([[t], [t * t]])),
-                                   t_range=[-2, 2], color=FOREGROUND_COLOR)
-        dot = always_redraw(lambda:
-                            Dot(number_line.n2p(t_param.get_value()), color=FOREGROUND_COLOR))
+        trace = VectorizedParametricFunction(lambda t: axes.c2p(np.array([[t], [t * t]])),
+                                             t_range=[-2, 2], color=FOREGROUND_COLOR)
+        dot = bind_position(Dot(color=FOREGROUND_COLOR), t_param, number_line.n2p, t_range=(-2, 2))
 
         self.add_fixed_in_frame_mobjects(real_func, top_func, real_func_example, number_line, axes, dot, trace)
         self.remove(trace, top_func)
@@ -349,10 +346,10 @@ class TopologicalContinuityScene(ThreeDScene):
         return sphere, top_func, axes
 
     def show_func_on_sphere(self, sphere, sphere_trace_func, axes, plot_trace_func, t_range=[0, TAU]):
-        sphere_trace = ParametricFunction(sphere_trace_func, t_range=t_range, color=ORANGE, stroke_width=3, z_index=1)
+        sphere_trace = VectorizedParametricFunction(sphere_trace_func, t_range=t_range, color=ORANGE, stroke_width=3, z_index=1)
         sphere_trace.move_to(sphere)
 
-        plot_trace_func = ParametricFunction(plot_trace_func, t_range=t_range, color=ORANGE)
+        plot_trace_func = VectorizedParametricFunction(plot_trace_func, t_range=t_range, color=ORANGE)
         self.add_fixed_in_frame_mobjects(plot_trace_func)
         self.remove(plot_trace_func)
         plot_trace_func.move_to(axes)
@@ -380,7 +377,7 @@ def cross_on_label_animation(label):
     return Succession(Write(cross), FadeOut(cross, run_time=0.5))
 
 
-class ContinuousSurjectionScene(Scene):
+class ContinuousSurjectionScene(TexCacheMixin, Scene):
     def construct(self):
         self.add_coord_plane(animate=True)
         cont_label = self.add_label(r'Continuous', animate=True)
@@ -390,16 +387,17 @@ class ContinuousSurjectionScene(Scene):
         def continuous_func(t):
             x = np.sin(1.3 * t)
             y = np.sin(1.4 * t) * np.sin(2 * t)
-            return np.array((3 * x, 3 * y, 0))
+            return np.array((3 * x, 3 * y, 0 * t))
 
         dot, path, t_param = self.add_moving_dot(continuous_func, t_range=[0, TAU], animate=True)
         self.draw_flash_then_fade(dot, path, FOREGROUND_COLOR, t_param, TAU)
         self.play(Transform(cont_label, onto_label))
 
         def oscillating_function(t):
-            return np.array(((t - 9) / 2, 2 * np.sin(50 * t), 0))
+            return np.array(((t - 9) / 2, 2 * np.sin(50 * t), 0 * t))
 
-        dot, path, t_param = self.add_moving_dot(oscillating_function, t_range=[0, 18], animate=False)
+        dot, path, t_param = self.add_moving_dot(oscillating_function, t_range=[0, 18], animate=False,
+                                                 adaptive=True)
         self.draw_flash_then_fade(dot, path, FOREGROUND_COLOR, t_param, 18)
 
         self.wait(2)
@@ -425,12 +423,12 @@ class ContinuousSurjectionScene(Scene):
 
         return number_plane
 
-    def add_moving_dot(self, func, t_range=[0, 1], animate=False):
+    def add_moving_dot(self, func, t_range=[0, 1], animate=False, adaptive=False):
         t_param = ValueTracker(0)
-        path = ParametricFunction(func, t_range=t_range, color=FOREGROUND_COLOR, stroke_width=4)
+        path = VectorizedParametricFunction(func, t_range=t_range, adaptive=adaptive, color=FOREGROUND_COLOR,
+                                            stroke_width=4)
 
-        dot = always_redraw(lambda:
-                            Dot(func(t_param.get_value()), color=FOREGROUND_COLOR, z_index=1))
+        dot = bind_position(Dot(color=FOREGROUND_COLOR, z_index=1), t_param, func, t_range)
         if animate:
             self.play(FadeIn(dot), run_time=0.5)
         else:
@@ -441,9 +439,9 @@ class ContinuousSurjectionScene(Scene):
     def draw_flash_then_fade(self, dot, path, color_choice, t_param, intersection_t, additional_animations=None):
         self.play(Create(path), t_param.animate.set_value(intersection_t), rate_func=linear, run_time=1.5)
         if additional_animations is None:
-            self.play(VGroup(dot, path).animate.set_color(color_choice), rate_func=there_and_back, run_time=0.5)
+            self.play(Recolor(VGroup(dot, path), color_choice), rate_func=there_and_back, run_time=0.5)
         else:
-            color_ani = AnimationGroup(VGroup(dot, path).animate.set_color(color_choice), rate_func=there_and_back,
+            color_ani = AnimationGroup(Recolor(VGroup(dot, path), color_choice), rate_func=there_and_back,
                                        run_time=0.5)
             self.play(color_ani, additional_animations)
             path.set_color(FOREGROUND_COLOR)
@@ -513,7 +511,7 @@ class ContinuousOverlapScene(ContinuousSurjectionScene):
         self.draw_flash_then_fade(dot, path, GREEN_B, t_param, stop_t, oto_label_check_animation)
 
 
-class CombinationTransitionScene(Scene):
+class CombinationTransitionScene(TexCacheMixin, Scene):
     def construct(self):
         combination_term = Tex(r'continuous $\qquad$', r'onto $\qquad$', r'one-to-one $\qquad$').to_edge(UP)
 
@@ -546,7 +544,7 @@ class CloseToSurjectionScene(ContinuousSurjectionScene):
         self.draw_flash_then_fade(dot, path, FOREGROUND_COLOR, t_param, 20)
 
 
-class FiniteFunctionScene(ThreeDScene):
+class FiniteFunctionScene(TexCacheMixin, ThreeDScene):
     def construct(self):
         self.next_section("Intro", skip_animations=True)
         onto_label = self.add_label(r'Onto')
@@ -772,7 +770,7 @@ class FiniteFunctionScene(ThreeDScene):
         self.play(green_move, red_move, run_time=2)
 
 
-class DefineInvertibleFuncScene(Scene):
+class DefineInvertibleFuncScene(TexCacheMixin, Scene):
     def construct(self):
         invertible = Tex(r'Invertible').set_color_by_gradient(ORANGE, MAROON_A).scale(1.5).shift(UP * 2)
         in_text = Tex(r'Input').scale(1.5).shift(LEFT * 3)
@@ -790,7 +788,7 @@ class DefineInvertibleFuncScene(Scene):
         self.wait(1)
 
 
-class TransitionToContinuousBijectionScene(Scene):
+class TransitionToContinuousBijectionScene(TexCacheMixin, Scene):
     def construct(self):
         leading_question = VGroup(
             Tex(r'1. Can a ', r'continuous', r' function', r' from ', r'$\mathbb R \to \mathbb R^2$', r' be '),
@@ -823,7 +821,7 @@ class TransitionToContinuousBijectionScene(Scene):
         self.wait(2)
 
 
-class HomeomorphicExamplesScene(ThreeDScene):
+class HomeomorphicExamplesScene(TexCacheMixin, ThreeDScene):
     def construct(self):
         self.set_camera_orientation(phi=70 * DEGREES, theta=35 * DEGREES)
         self.begin_ambient_camera_rotation(0.15)
@@ -862,7 +860,7 @@ class HomeomorphicExamplesScene(ThreeDScene):
         self.play(FadeOut(torus[2]))
 
 
-class FlatHomeomorphismExampleScene(Scene):
+class FlatHomeomorphismExampleScene(TexCacheMixin, Scene):
     def construct(self):
         self.show_simple_shapes()
         self.show_line_examples()
@@ -1000,7 +998,7 @@ class FlatHomeomorphismExampleScene(Scene):
         self.remove(lines_2)
         self.add(lines_3)
         self.play(*[MoveToTarget(line) for line in lines_3])
-        self.play(lines_3.animate.set_color(RED_B), rate_func=there_and_back)
+        self.play(Recolor(lines_3, RED_B), rate_func=there_and_back)
         discontinuity = Dot(lines_3[3].get_end(), color=RED_E, radius=0.15)
         self.play(FadeIn(discontinuity), run_time=0.5)
         self.play(Indicate(discontinuity))
@@ -1010,7 +1008,7 @@ class FlatHomeomorphismExampleScene(Scene):
         self.play(FadeOut(lines_3, cross))
 
 
-class SphereVersusDonutScene(ThreeDScene):
+class SphereVersusDonutScene(TexCacheMixin, ThreeDScene):
     def construct(self):
         sphere = Sphere(radius=1.3, checkerboard_colors=[BLUE_B, LIGHT_GRAY], resolution=RESOLUTION).shift(1.5 * RIGHT)
         sphere_cpy = sphere.copy()
@@ -1037,7 +1035,7 @@ class SphereVersusDonutScene(ThreeDScene):
         self.play(FadeIn(torus_main), sphere_cpy.animate.shift(2 * RIGHT))
         self.wait(3)
 
-class ChangedQuestionScene(Scene):
+class ChangedQuestionScene(TexCacheMixin, Scene):
     def construct(self):
         start_title = VGroup(Tex(r'Continuous and invertible '), MathTex(r'f', r':[0, 1]', r' \to ', r'[0, 1]^2'))\
             .arrange(RIGHT).set_color_by_gradient(ORANGE, MAROON, BLUE)
@@ -1081,7 +1079,7 @@ COLOR_GRAD = [PURPLE_B, MAROON_B, BLUE_C, TEAL_C, YELLOW_C, GREEN_C, LIGHT_BROWN
 ROTATION_CONSTANT = (20 * DEGREES, RIGHT + UP + OUT)
 
 
-class TopologyOfLineScene(ThreeDScene):
+class TopologyOfLineScene(TexCacheMixin, ThreeDScene):
     def construct(self):
         self.set_camera_orientation(phi=70 * DEGREES, theta=220 * DEGREES)
         self.begin_ambient_camera_rotation(0.15)
@@ -1122,7 +1120,7 @@ class TopologyOfLineScene(ThreeDScene):
 
         intersection_pt = Dot3D(loop_func(intersection_t), color=RED_B, radius=0.15, z_index=2)
 
-        loop = ParametricFunction(loop_func, t_range=[0, 1], stroke_width=10, stroke_color=FOREGROUND_COLOR, z_index=1)
+        loop = VectorizedParametricFunction(loop_func, t_range=[0, 1], stroke_width=10, stroke_color=FOREGROUND_COLOR, z_index=1)
 
         if animate:
             self.play(Write(line))
@@ -1138,81 +1136,13 @@ class TopologyOfLineScene(ThreeDScene):
         def hilbertCurve(order=1, x_initial=0, y_initial=0):
             segment_length = 5 / (2 ** order)
             stroke_width = (-3 / 7) * order + (31 / 7)
-            segments = VGroup()
-
-            directions = hilbert(level=order)
-            prevCenter = np.array((x_initial, y_initial, 0.))
-
-            for direct in directions:
-                dirTranslate = UP
-                if direct == 'LEFT':
-                    dirTranslate = LEFT
-                if direct == 'RIGHT':
-                    dirTranslate = RIGHT
-                if direct == 'DOWN':
-                    dirTranslate = DOWN
-
-                endPt = np.copy(prevCenter + (segment_length * dirTranslate))
-                segments.add(Line3D(start=prevCenter, end=endPt, stroke_width=stroke_width, resolution=3))
-                prevCenter = endPt
-
-            segments.set_color_by_gradient(*COLOR_GRAD)
-
-            return segments
-
-        def hilbert(level=1, direction='UP'):
-            directions = []
-            if level == 1:
-                if direction == 'LEFT':
-                    directions.append('RIGHT')
-                    directions.append('DOWN')
-                    directions.append('LEFT')
-                if direction == 'RIGHT':
-                    directions.append('LEFT')
-                    directions.append('UP')
-                    directions.append('RIGHT')
-                if direction == 'UP':
-                    directions.append('DOWN')
-                    directions.append('RIGHT')
-                    directions.append('UP')
-                if direction == 'DOWN':
-                    directions.append('UP')
-                    directions.append('LEFT')
-                    directions.append('DOWN')
-            else:
-                if direction == 'LEFT':
-                    directions.extend(hilbert(level - 1, 'UP'))
-                    directions.append('RIGHT')
-                    directions.extend(hilbert(level - 1, 'LEFT'))
-                    directions.append('DOWN')
-                    directions.extend(hilbert(level - 1, 'LEFT'))
-                    directions.append('LEFT')
-                    directions.extend(hilbert(level - 1, 'DOWN'))
-                if direction == 'RIGHT':
-                    directions.extend(hilbert(level - 1, 'DOWN'))
-                    directions.append('LEFT')
-                    directions.extend(hilbert(level - 1, 'RIGHT'))
-                    directions.append('UP')
-                    directions.extend(hilbert(level - 1, 'RIGHT'))
-                    directions.append('RIGHT')
-                    directions.extend(hilbert(level - 1, 'UP'))
-                if direction == 'UP':
-                    directions.extend(hilbert(level - 1, 'LEFT'))
-                    directions.append('DOWN')
-                    directions.extend(hilbert(level - 1, 'UP'))
-                    directions.append('RIGHT')
-                    directions.extend(hilbert(level - 1, 'UP'))
-                    directions.append('UP')
-                    directions.extend(hilbert(level - 1, 'RIGHT'))
-                if direction == 'DOWN':
-                    directions.extend(hilbert(level - 1, 'RIGHT'))
-                    directions.append('UP')
-                    directions.extend(hilbert(level - 1, 'DOWN'))
-                    directions.append('LEFT')
-                    directions.extend(hilbert(level - 1, 'DOWN'))
-                    directions.append('DOWN')
-                    directions.extend(hilbert(level - 1, 'LEFT'))
-            return directions
+            _, num_chunks = chunk_layout(4 ** order - 1)
+
+            points, rgbs = cached_curve('hilbert', order, (x_initial, y_initial, 0), segment_length, COLOR_GRAD,
+                                        num_chunks,
+                                        lambda: hilbert_curve_points(order, x_initial, y_initial, segment_length))
+
+            return TubePath(points, stroke_width=stroke_width).set_chunk_colors(rgbs)
 
         curves = [hilbertCurve(i + 1).rotate(ROTATION_CONSTANT[0], ROTATION_CONSTANT[1]).center() for i in range(4)]
         line = Line3D(start=LEFT * 3, end=RIGHT * 3, stroke_width=6)
@@ -1261,7 +1191,7 @@ class TopologyOfLineScene(ThreeDScene):
             self.play(Indicate(plane))
             self.wait(5)
 
-class SineGetsCloseScene(Scene):
+class SineGetsCloseScene(TexCacheMixin, Scene):
     def construct(self):
         start_title = VGroup(Tex(r'Continuous and invertible '), MathTex(r'f', r':[0, 1]', r' \to ', r'[0, 1]^2'))\
             .arrange(RIGHT).set_color_by_gradient(ORANGE, MAROON, BLUE)
@@ -1292,24 +1222,17 @@ class SineGetsCloseScene(Scene):
         s = ValueTracker(0)
 
         def osc_func(t):
-            pt = axes.c2p(2*t - 1, np.sin(400 * t))
-            return np.array((pt[0], pt[1], 0))
-
-        spiral_curve = always_redraw(lambda:
-                                     ParametricFunction(osc_func, t_range=(0, 1, 0.001),
-                                                        fill_opacity=0,
-                                                        color=ORANGE,
-                                                        stroke_opacity=0.9,
-                                                        stroke_width= 2.5 - s.get_value() * 2)
-                                     )
+            return axes.c2p(2*t - 1, np.sin(400 * t))
+
+        spiral_curve = VectorizedParametricFunction(osc_func, t_range=(0, 1, 0.01), adaptive=True,
+                                                    fill_opacity=0,
+                                                    color=ORANGE,
+                                                    stroke_opacity=0.9,
+                                                    stroke_width=2.5)
+        bind_style(spiral_curve, s, stroke_width=lambda value: 2.5 - value * 2)
         follow_dot = always_redraw(lambda: Dot(spiral_curve.get_end(), color=MAROON))
         tracker = ValueTracker(0)
-        dot = always_redraw(lambda:
-                            Dot(in_line.n2p(tracker.get_value()),
-                                color=MAROON,
-                                radius=0.1,
-                                fill_opacity=1)
-                            )
+        dot = bind_position(Dot(color=MAROON, radius=0.1, fill_opacity=1), tracker, in_line.n2p)
         self.play(FadeIn(dot, follow_dot))
         self.play(tracker.animate.set_value(1), Create(spiral_curve), rate_func=linear, run_time=2)
         not_oto_onto = Tex(r'Close, but not one-to-one and onto.').set_color([ORANGE, MAROON]).to_edge(DOWN, buff=0.5)
@@ -1324,17 +1247,24 @@ class SineGetsCloseScene(Scene):
         self.wait()
 
 
-class FurtherExplorationScene(Scene):
+class FurtherExplorationScene(TexCacheMixin, Scene):
     def construct(self):
         very_original_question = Tex(r'Can a linear transformation from $\mathbb R^2$ to $\mathbb R^3$ be onto?')
-        original_question = Tex(r'Can a continuous function from $\mathbb R^2$ to $\mathbb R^3$ be onto?')
-        question = Tex(
-            r'Why can there never exist a one to one and onto function \\ from $\mathbb R^2$ to $\mathbb R^3$?')
-        final_question_1 = Tex(r'How did our equivalence  \\ relation work? \\ How can we generalize equivalence?')
-        final_question_2 = Tex(
-            r'In what ways do invertible \\ continuous functions define \\ an equivalence of shapes?')
-
         very_original_question.to_edge(UP, buff=1).set_color_by_gradient(BLUE, GREEN)
+        # The rest compile while the first question is written out
+        questions = TexFuture(lambda: [
+            Tex(r'Can a continuous function from $\mathbb R^2$ to $\mathbb R^3$ be onto?'),
+            Tex(r'Why can there never exist a one to one and onto function \\ from $\mathbb R^2$ to $\mathbb R^3$?'),
+        ])
+        final_questions = TexFuture(lambda: [
+            Tex(r'How did our equivalence  \\ relation work? \\ How can we generalize equivalence?'),
+            Tex(r'In what ways do invertible \\ continuous functions define \\ an equivalence of shapes?'),
+        ])
+
+        self.play(Write(very_original_question))
+        self.wait()
+
+        original_question, question = questions.result()
         original_question.set_color_by_gradient(BLUE, GREEN)
         question.to_edge(DOWN, buff=1).set_color_by_gradient(BLUE, GREEN)
 
@@ -1345,8 +1275,6 @@ class FurtherExplorationScene(Scene):
                 [YELLOW, BLUE]).scale(0.5),
         ]
 
-        self.play(Write(very_original_question))
-        self.wait()
         self.play(FadeIn(arrows[0], run_time=0.5), Write(original_question))
         self.wait()
         self.play(FadeIn(arrows[1], run_time=0.5), Write(question))
@@ -1356,6 +1284,7 @@ class FurtherExplorationScene(Scene):
             question.animate.to_edge(UP, buff=1)
         )
 
+        final_question_1, final_question_2 = final_questions.result()
         final_question_2.to_edge(LEFT, buff=1).set_color_by_gradient(GOLD, BLUE)
         final_question_1.to_corner(DR, buff=1).set_color_by_gradient(GOLD, BLUE)
 
@@ -0,0 +1,193 @@
+from manim import *
+
+from hilbert import hilbert_segment
+from mobjects import GradientPolyline, polyline_points, set_rgbs
+
+
+class HilbertRefinement(Animation):
+    """Grows H_n into H_(n+1) without any shape matching.
+
+    Each cell of H_n becomes four consecutive cells of H_(n+1), so vertex i of the finer
+    curve starts on vertex i // 4 of the coarser one. Every frame is then one lerp
+    between two precomputed point arrays.
+    """
+
+    def __init__(self, coarse: GradientPolyline, fine: GradientPolyline, **kwargs):
+        parent = coarse.get_vertices()
+        child = fine.get_vertices()
+        if len(child) != 4 * len(parent):
+            raise ValueError('HilbertRefinement needs consecutive orders, got {} and {} vertices'
+                             .format(len(parent), len(child)))
+
+        self.coarse = coarse
+        self.start_points = polyline_points(parent[np.arange(len(child)) // 4])
+        self.delta = polyline_points(child) - self.start_points
+        self.buffer = np.empty_like(self.start_points)
+        self.slices = fine.chunk_slices()
+        self.start_width = coarse.submobjects[0].get_stroke_width()
+        self.end_width = fine.submobjects[0].get_stroke_width()
+        super().__init__(fine, introducer=True, **kwargs)
+
+    def _setup_scene(self, scene):
+        if scene is not None:
+            scene.remove(self.coarse)
+        super()._setup_scene(scene)
+
+    def create_starting_mobject(self):
+        # Both ends are already stored as arrays, no need to copy the whole curve
+        return Mobject()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        np.multiply(self.delta, alpha, out=self.buffer)
+        self.buffer += self.start_points
+        for chunk, part in zip(self.mobject.submobjects, self.slices):
+            chunk.points = self.buffer[part]
+        self.mobject.set_stroke(width=interpolate(self.start_width, self.end_width, alpha))
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        # Stop the chunks from sharing the animation's buffer
+        for chunk in self.mobject.submobjects:
+            chunk.points = chunk.points.copy()
+
+
+class Recolor(Animation):
+    """mobject.animate.set_color(color) without copying the mobject into a target.
+
+    The stroke and fill colours of the whole family are stacked into one array up front,
+    so a frame is a single lerp plus writing the rows back in place.
+    """
+
+    def __init__(self, mobject: Mobject, color, **kwargs):
+        self.rgb = color_to_rgb(color)
+        super().__init__(mobject, **kwargs)
+
+    def begin(self) -> None:
+        # Gathered here rather than in __init__, since updaters like always_redraw swap the arrays out
+        family = [mob for mob in self.mobject.family_members_with_points() if isinstance(mob, VMobject)]
+        self.arrays = [array for mob in family for array in (mob.stroke_rgbas, mob.fill_rgbas)]
+        ends = np.cumsum([len(array) for array in self.arrays])
+        self.slices = [slice(end - len(array), end) for array, end in zip(self.arrays, ends)]
+
+        self.start_rgbs = np.concatenate([array[:, :3] for array in self.arrays])
+        self.delta = self.rgb - self.start_rgbs
+        self.buffer = np.empty_like(self.start_rgbs)
+        super().begin()
+
+    def create_starting_mobject(self):
+        return Mobject()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        np.multiply(self.delta, self.rate_func(alpha), out=self.buffer)
+        self.buffer += self.start_rgbs
+        for array, part in zip(self.arrays, self.slices):
+            array[:, :3] = self.buffer[part]
+
+
+class HighlightSweep(Animation):
+    """Lights up the stretch of a Hilbert curve GradientPolyline just behind H_n(alpha).
+
+    Chunks lying wholly inside the lit window are recoloured, and only the ones entering or
+    leaving it on a frame, so the cost does not depend on how long the curve is. The lit
+    part of the two chunks the window ends in is drawn over them, segment by segment, so
+    the window follows H_n(alpha) exactly rather than jumping a chunk at a time.
+    """
+
+    def __init__(self, polyline: GradientPolyline, color=WHITE, span=1 / 32, **kwargs):
+        self.rgb = color_to_rgb(color)
+        self.span = span
+        # Taken now, since an animation played alongside (e.g. Create) may change the points
+        self.vertices = polyline.get_vertices()
+        # H_n has 4^n vertices
+        self.order = (len(self.vertices).bit_length() - 1) // 2
+        self.rgbs = np.array([chunk.stroke_rgbas[0, :3] for chunk in polyline.submobjects])
+        self.lit = set()
+        width = polyline.submobjects[0].get_stroke_width()
+        self.ends = VGroup(*[VMobject(stroke_color=color, stroke_width=width) for _ in range(2)])
+        super().__init__(polyline, **kwargs)
+
+    def _setup_scene(self, scene):
+        super()._setup_scene(scene)
+        if scene is not None:
+            # Added after the curve, so it is drawn over it and (under Cairo) redrawn every frame with it
+            scene.add(self.ends)
+
+    def create_starting_mobject(self):
+        return Mobject()
+
+    def position(self, t):
+        index, fraction = hilbert_segment(t, self.order)
+        return int(index), float(fraction)
+
+    def stretch(self, start, end):
+        # Polyline points along the curve between two (segment index, fraction) positions
+        (i, f), (j, g) = start, end
+        v = self.vertices
+        return polyline_points(np.concatenate([[v[i] + f * (v[i + 1] - v[i])], v[i + 1:j + 1],
+                                               [v[j] + g * (v[j + 1] - v[j])]]))
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        t = self.rate_func(alpha)
+        size = self.mobject.chunk_size
+        start, end = self.position(t - self.span), self.position(t)
+        first, last = start[0] // size, end[0] // size
+
+        if first == last:
+            self.ends[0].set_points(self.stretch(start, end))
+            self.ends[1].clear_points()
+        else:
+            self.ends[0].set_points(self.stretch(start, ((first + 1) * size - 1, 1.)))
+            self.ends[1].set_points(self.stretch((last * size, 0.), end))
+
+        lit = set(range(first + 1, last))
+        self.recolor(self.lit - lit, self.rgbs)
+        self.recolor(lit - self.lit, np.broadcast_to(self.rgb, self.rgbs.shape))
+        self.lit = lit
+
+    def recolor(self, indices, rgbs):
+        indices = sorted(indices)
+        set_rgbs([self.mobject.submobjects[i] for i in indices], rgbs[indices])
+
+    def clean_up_from_scene(self, scene):
+        self.recolor(self.lit, self.rgbs)
+        self.lit = set()
+        scene.remove(self.ends)
+        super().clean_up_from_scene(scene)
+
+
+class TrajectoryAnimation(Animation):
+    """Animation whose moving points are vectorized functions of the rated alpha.
+
+    Subclasses implement trajectory(alphas), returning named (N, 3) point arrays for an
+    array of alphas, and apply_trajectory(points), placing the mobject from one point of
+    each. The whole run is tabulated with a single trajectory call, one row per frame, so
+    a frame is just a lookup. get_trajectory hands out that same table, e.g. to draw the
+    path of a point without tracing it frame by frame.
+    """
+
+    def __init__(self, mobject: Mobject, samples=None, **kwargs):
+        self.samples = samples
+        self.table = None
+        super().__init__(mobject, **kwargs)
+
+    def trajectory(self, alphas):
+        raise NotImplementedError
+
+    def apply_trajectory(self, points):
+        raise NotImplementedError
+
+    def get_trajectory(self, name=None):
+        if self.table is None:
+            samples = self.samples or int(np.ceil(self.run_time * config.frame_rate)) + 1
+            self.alphas = np.linspace(0, 1, samples)
+            self.table = self.trajectory(self.alphas)
+        return self.table if name is None else self.table[name]
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        table = self.get_trajectory()
+        position = np.clip(self.rate_func(alpha), 0, 1) * (len(self.alphas) - 1)
+        i = min(int(position), len(self.alphas) - 2)
+        fraction = position - i
+        self.apply_trajectory({name: points[i] + fraction * (points[i + 1] - points[i])
+                               for name, points in table.items()})
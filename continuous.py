@@ -1,13 +1,19 @@
 import numpy as np
 from manim import *
-import time
-from datetime import datetime
 
 from manim.mobject.geometry.tips import ArrowTriangleFilledTip, ArrowTriangleTip
 from manim.utils.rate_functions import ease_in_expo, ease_out_expo
 
+from animations import HighlightSweep, HilbertRefinement, Recolor
+from geometry_cache import TexCacheMixin, cached_curve
+from hilbert import hilbert3d_curve_points, hilbert_curve_points
+from mobjects import GlyphDecimalNumber, GradientPolyline, TubePath, chunk_layout
+from parametric import VectorizedParametricFunction
+from tex_batch import TexFuture, batch_tex
+from updaters import bind_position, bind_scale, bind_style, updater_scheduler
 
-class IntroScene(Scene):
+
+class IntroScene(TexCacheMixin, Scene):
     def construct(self):
         title = Tex(r'Can a ', 'continuous ', 'function ', r'$f$ ', r'$:$ ', r'$\mathbb R $', r'$\to $',
                     r'$\mathbb R^2$ ', r' be onto?').set_color_by_gradient(BLUE, GREEN)
@@ -47,24 +53,20 @@ class IntroScene(Scene):
         axes.shift(RIGHT * 3 + (DOWN / 2))
 
         def sine_func(t):
-            pt = axes.c2p(t, np.sin(4 * PI * t))
-            return np.array((pt[0], pt[1], 0))
+            return axes.c2p(t, np.sin(4 * PI * t))
 
-        sine_wave = ParametricFunction(sine_func, t_range=np.array([0, 1]), fill_opacity=0, color=BLUE_B)
-        follow_dot = always_redraw(lambda: Dot(sine_wave.get_end(), color=BLUE_E))
+        sine_wave = VectorizedParametricFunction(sine_func, t_range=np.array([0, 1]), fill_opacity=0, color=BLUE_B)
+        follow_dot = updater_scheduler.redraw(lambda: Dot(sine_wave.get_end(), color=BLUE_E), sine_wave.get_end)
 
         in_line = NumberLine(x_range=np.array([0, 4])).shift(LEFT * 3.5)
         tracker = ValueTracker(0)
-        dot = always_redraw(lambda:
-                            Dot(in_line.n2p(4 * tracker.get_value()),
-                                color=BLUE_E,
-                                radius=0.15,
-                                fill_opacity=1)
-                            )
-        number = DecimalNumber(0, color=BLUE_E).next_to(dot, UP)
+        dot = bind_position(Dot(color=BLUE_E, radius=0.15, fill_opacity=1), tracker, lambda t: in_line.n2p(4 * t))
+        number = GlyphDecimalNumber(0, color=BLUE_E).next_to(dot, UP)
 
-        number.add_updater(lambda m: m.next_to(dot, UP))
-        number.add_updater(lambda m: m.set_value(((dot.get_center() - (LEFT * 3.5)) / 4)[0] + 0.5))
+        updater_scheduler.add_updater(number, lambda m: m.next_to(dot, UP), dot.get_center)
+        updater_scheduler.add_updater(number,
+                                      lambda m: m.set_value(((dot.get_center() - (LEFT * 3.5)) / 4)[0] + 0.5),
+                                      dot.get_center)
 
         seperate = ['=', '(t)', r'\sin']
         function_equation = MathTex(r'f(t) = (t, \,', r'\sin(4 \pi t))', color=BLUE_A, substrings_to_isolate=seperate)
@@ -88,22 +90,19 @@ class IntroScene(Scene):
                   TransformMatchingTex(function_equation, hunction_equation), run_time=0.5)
 
         def dbl_sine(t):
-            pt = axes.c2p(0.5 + (0.5 * np.sin(2 * PI * t) * np.sin(3 * PI * t)), np.sin(2 * PI * t))
-            return np.array((pt[0], pt[1], 0))
+            return axes.c2p(0.5 + (0.5 * np.sin(2 * PI * t) * np.sin(3 * PI * t)), np.sin(2 * PI * t))
 
-        dbl_sine_wave = ParametricFunction(dbl_sine, t_range=np.array([0, 1]), fill_opacity=0, color=BLUE_B)
-        h_follow_dot = always_redraw(lambda: Dot(dbl_sine_wave.get_end(), color=BLUE_E))
+        dbl_sine_wave = VectorizedParametricFunction(dbl_sine, t_range=np.array([0, 1]), fill_opacity=0, color=BLUE_B)
+        h_follow_dot = updater_scheduler.redraw(lambda: Dot(dbl_sine_wave.get_end(), color=BLUE_E),
+                                               dbl_sine_wave.get_end)
         tracker.set_value(0)
-        h_dot = always_redraw(lambda:
-                              Dot(in_line.n2p(4 * tracker.get_value()),
-                                  color=BLUE_E,
-                                  radius=0.15,
-                                  fill_opacity=1)
-                              )
-        h_number = DecimalNumber(0, color=BLUE_E).next_to(h_dot, UP)
+        h_dot = bind_position(Dot(color=BLUE_E, radius=0.15, fill_opacity=1), tracker, lambda t: in_line.n2p(4 * t))
+        h_number = GlyphDecimalNumber(0, color=BLUE_E).next_to(h_dot, UP)
 
-        h_number.add_updater(lambda m: m.next_to(h_dot, UP))
-        h_number.add_updater(lambda m: m.set_value(((h_dot.get_center() - (LEFT * 3.5)) / 4)[0] + 0.5))
+        updater_scheduler.add_updater(h_number, lambda m: m.next_to(h_dot, UP), h_dot.get_center)
+        updater_scheduler.add_updater(h_number,
+                                      lambda m: m.set_value(((h_dot.get_center() - (LEFT * 3.5)) / 4)[0] + 0.5),
+                                      h_dot.get_center)
 
         self.add(h_dot, h_follow_dot, h_number)
         self.play(Create(dbl_sine_wave), tracker.animate.set_value(1), run_time=3, rate_func=linear)
@@ -117,21 +116,24 @@ class IntroScene(Scene):
                   TransformMatchingTex(hunction_equation, gunction_equation), run_time=0.5)
 
         def inv_sine_func(t):
-            pt = axes.c2p(t, np.sin(50 / (t + 0.01)))
-            return np.array((pt[0], pt[1], 0))
-
-        inv_sine_wave = ParametricFunction(inv_sine_func, t_range=np.array([0, 1]), fill_opacity=0, color=BLUE_B)
-        g_follow_dot = always_redraw(lambda: Dot(inv_sine_wave.get_end(), color=BLUE_E))
-        g_dot = always_redraw(lambda:
-                              Dot(in_line.n2p(4 * (axes.p2c(inv_sine_wave.get_end()))[0]),
-                                  color=BLUE_E,
-                                  radius=0.15,
-                                  fill_opacity=1)
-                              )
-        g_number = DecimalNumber(0, color=BLUE_E).next_to(g_dot, UP)
-
-        g_number.add_updater(lambda m: m.next_to(g_dot, UP))
-        g_number.add_updater(lambda m: m.set_value(((g_dot.get_center() - (LEFT * 3.5)) / 4)[0] + 0.5))
+            return axes.c2p(t, np.sin(50 / (t + 0.01)))
+
+        inv_sine_wave = VectorizedParametricFunction(inv_sine_func, t_range=np.array([0, 1]), adaptive=True,
+                                                     fill_opacity=0, color=BLUE_B)
+        g_follow_dot = updater_scheduler.redraw(lambda: Dot(inv_sine_wave.get_end(), color=BLUE_E),
+                                               inv_sine_wave.get_end)
+        g_dot = updater_scheduler.redraw(lambda:
+                                         Dot(in_line.n2p(4 * (axes.p2c(inv_sine_wave.get_end()))[0]),
+                                             color=BLUE_E,
+                                             radius=0.15,
+                                             fill_opacity=1),
+                                         inv_sine_wave.get_end)
+        g_number = GlyphDecimalNumber(0, color=BLUE_E).next_to(g_dot, UP)
+
+        updater_scheduler.add_updater(g_number, lambda m: m.next_to(g_dot, UP), g_dot.get_center)
+        updater_scheduler.add_updater(g_number,
+                                      lambda m: m.set_value(((g_dot.get_center() - (LEFT * 3.5)) / 4)[0] + 0.5),
+                                      g_dot.get_center)
 
         self.add(g_dot, g_follow_dot, g_number)
         self.play(Create(inv_sine_wave, run_time=3, rate_func=linear))
@@ -141,15 +143,16 @@ class IntroScene(Scene):
 BACKGROUND_COLOR = BLUE
 FOREGROUND_COLOR = BLUE_C
 
-class ContinuousSurjectionScene(Scene):
+class ContinuousSurjectionScene(TexCacheMixin, Scene):
     def construct(self):
         self.add_coord_plane(animate=True)
         self.add_label(r'Onto', animate=True)
 
         def oscillating_function(t):
-            return np.array((t - 9, 5 * np.sin(50 * t), 0))
+            return np.array((t - 9, 5 * np.sin(50 * t), 0 * t))
 
-        dot, path, t_param = self.add_moving_dot(oscillating_function, t_range=[0, 18], animate=True)
+        dot, path, t_param = self.add_moving_dot(oscillating_function, t_range=[0, 18], animate=True,
+                                                 adaptive=True)
         self.draw_flash_then_fade(dot, path, FOREGROUND_COLOR, t_param, 18)
 
     def add_coord_plane(self, animate=False):
@@ -173,12 +176,12 @@ class ContinuousSurjectionScene(Scene):
 
         return number_plane
 
-    def add_moving_dot(self, func, t_range=[0, 1], animate=False):
+    def add_moving_dot(self, func, t_range=[0, 1], animate=False, adaptive=False):
         t_param = ValueTracker(0)
-        path = ParametricFunction(func, t_range=t_range, color=FOREGROUND_COLOR, stroke_width=4)
+        path = VectorizedParametricFunction(func, t_range=t_range, adaptive=adaptive, color=FOREGROUND_COLOR,
+                                            stroke_width=4)
 
-        dot = always_redraw(lambda:
-                            Dot(func(t_param.get_value()), color=FOREGROUND_COLOR, z_index=1))
+        dot = bind_position(Dot(color=FOREGROUND_COLOR, z_index=1), t_param, func, t_range)
         if animate:
             self.play(FadeIn(dot), run_time=0.5)
         else:
@@ -189,9 +192,9 @@ class ContinuousSurjectionScene(Scene):
     def draw_flash_then_fade(self, dot, path, color_choice, t_param, intersection_t, additional_animations=None):
         self.play(Create(path), t_param.animate.set_value(intersection_t), rate_func=linear, run_time=5)
         if additional_animations is None:
-            self.play(VGroup(dot, path).animate.set_color(color_choice), rate_func=there_and_back, run_time=0.5)
+            self.play(Recolor(VGroup(dot, path), color_choice), rate_func=there_and_back, run_time=0.5)
         else:
-            color_ani = AnimationGroup(VGroup(dot, path).animate.set_color(color_choice), rate_func=there_and_back,
+            color_ani = AnimationGroup(Recolor(VGroup(dot, path), color_choice), rate_func=there_and_back,
                                        run_time=0.5)
             self.play(color_ani, additional_animations)
             path.set_color(FOREGROUND_COLOR)
@@ -209,35 +212,39 @@ class ContinuousSurjectionScene(Scene):
 
         return label
 
-class LineWidthScene(Scene):
+class LineWidthScene(TexCacheMixin, Scene):
     def construct(self):
         def scribble_func(t):
-            return np.array((t, np.sin(t) + np.cos(9 * t), 0))
+            return np.array((t, np.sin(t) + np.cos(9 * t), 0 * t))
 
         t_param = ValueTracker(0)
 
-        scribble = always_redraw(lambda: ParametricFunction(scribble_func,
-                                                            t_range=[0, 2],
-                                                            stroke_color=BLUE_C,
-                                                            stroke_width=(-19 / 5) * t_param.get_value() + 5)
-                                 .scale(2 + (20 * t_param.get_value())).center())
+        def zoom(t):
+            return 2 + (20 * t)
+
+        def line_width(t):
+            return (-19 / 5) * t + 5
 
-        axes = always_redraw(lambda: Axes(
+        # Built once, then zoomed from cached points as t_param moves
+        scribble = VectorizedParametricFunction(scribble_func, t_range=[0, 2], stroke_color=BLUE_C).center()
+        bind_scale(scribble, t_param, zoom)
+        bind_style(scribble, t_param, stroke_width=line_width)
+
+        axes = Axes(
             x_range=(-10, 10, 1),
             y_range=(-10, 10, 1),
             x_length=15,
             y_length=15
-        ).scale(2 + (20 * t_param.get_value())))
+        )
+        bind_scale(axes, t_param, zoom)
 
-        dot = always_redraw(lambda: Dot(
-                                        color=BLUE_C,
-                                        stroke_width= (-19 / 5) * t_param.get_value() + 5))
+        dot = bind_style(Dot(color=BLUE_C), t_param, stroke_width=line_width)
 
         self.play(Create(scribble), FadeIn(dot), DrawBorderThenFill(axes))
         self.play(t_param.animate.set_value(1), run_time=7)
 
 
-class LineTransitionScene(Scene):
+class LineTransitionScene(TexCacheMixin, Scene):
     def construct(self):
         label = MathTex(r'f: ', r'\mathbb R', r' \to ', r'\mathbb R', r'^2').to_edge(UP, buff=2).scale(1.3)
         #onto_label = Text(r'Onto', gradient=[BLUE_A, BLUE_B]).next_to(label, LEFT, buff=2)
@@ -296,7 +303,7 @@ class LineTransitionScene(Scene):
                           small_lines[2], small_lines[3]))
 
 
-class ScribblePlane(Scene):
+class ScribblePlane(TexCacheMixin, Scene):
     def construct(self):
 
         self.add_coord_plane(animate=True)
@@ -312,12 +319,11 @@ class ScribblePlane(Scene):
 
         tracker = ValueTracker(0)
 
-        scribble = always_redraw(lambda:
-                                 ParametricFunction(scribble_func,
-                                                    t_range=[0, 1],
-                                                    stroke_color=BLUE_C,
-                                                    stroke_width=5 - (4 * tracker.get_value())).scale(5).center()
-                                 )
+        scribble = VectorizedParametricFunction(scribble_func,
+                                                t_range=[0, 1],
+                                                stroke_color=BLUE_C,
+                                                stroke_width=5).scale(5).center()
+        bind_style(scribble, tracker, stroke_width=lambda value: 5 - (4 * value))
 
         self.play(Create(rect), run_time=0.5)
         self.play(Create(scribble), run_time=3)
@@ -346,85 +352,76 @@ class ScribblePlane(Scene):
         return number_plane
 
 
-class SpaceFillingCurveScene(ZoomedScene):
+class SpaceFillingCurveScene(TexCacheMixin, ZoomedScene):
     def construct(self):
         self.image_frame_stroke_width = 2
         self.zoomed_display_height = 5
         self.zoomed_display_width = 5
         order = 8
-        hilbertCurves = []
-        hilbert_label = []
-        for i in range(order + 1):
-            timestamp = datetime.fromtimestamp(time.time())
-            print('Generating curve ', (i + 1), ' TIMESTAMP: ', timestamp)
-            curve = self.hilbertCurve(order=i + 1)
-            curve.center().shift(UP * 0.5)
-            hilbertCurves.append(curve)
-            hilbert_label.append(MathTex(r'H_', str(i + 1), r': [0, 1] \to [0, 1]^2')
-                                 .to_edge(DOWN).shift(RIGHT).scale(0.7))
+        # Curves are built one order ahead of what is on screen and dropped once replaced
+        stages = self.hilbertStages(order)
+        curve, label = next(stages)
 
         number_line = NumberLine(x_range=[0, 1], include_numbers=True)
-        number_line.next_to(hilbert_label[0], LEFT, buff=1)
+        number_line.next_to(label, LEFT, buff=1)
         tracker = ValueTracker(0)
         dot = always_redraw(lambda: Dot(number_line.n2p(tracker.get_value()), color=BLUE_E))
 
-        transformations = []
-        for i in range(order):
-            timestamp = datetime.fromtimestamp(time.time())
-            print('Generating transform animation ', (i + 1), ' TIMESTAMP: ', timestamp)
-            transformations.append(TransformMatchingShapes(hilbertCurves[i], hilbertCurves[i + 1],
-                                                           transform_mismatches=True))
-
         self.clear()
-        self.play(Create(hilbertCurves[0]), Write(hilbert_label[0], run_time=0.4), FadeIn(number_line, run_time=0.4))
+        self.play(Create(curve), Write(label, run_time=0.4), FadeIn(number_line, run_time=0.4))
         for i in range(4):
-            self.play(FadeOut(hilbertCurves[i]), run_time=0.5)
+            next_curve, next_label = next(stages)
+            self.play(FadeOut(curve), run_time=0.5)
             tracker.set_value(0)
             self.add(dot)
             dot_animation = AnimationGroup(tracker.animate.set_value(1), rate_func=linear, run_time=0.5 * (i + 1))
-            self.play(TransformMatchingTex(hilbert_label[i], hilbert_label[i + 1], run_time=0.5),
-                      Create(hilbertCurves[i + 1], run_time=0.5 * (i + 1)),
-                      dot_animation
+            # The segments at the dot's t shine white, so Create keeps the dot's pace chunk for chunk
+            self.play(TransformMatchingTex(label, next_label, run_time=0.5),
+                      Create(next_curve, rate_func=linear, run_time=0.5 * (i + 1)),
+                      dot_animation,
+                      HighlightSweep(next_curve, rate_func=linear, run_time=0.5 * (i + 1))
                       )
             self.play(FadeOut(dot), run_time=0.5)
+            curve, label = next_curve, next_label
 
         self.activate_zooming(animate=True)
         for i in range(4, order):
-            self.play(transformations[i])
+            next_curve, next_label = next(stages)
+            self.play(HilbertRefinement(curve, next_curve))
             self.wait(1)
+            curve, label = next_curve, next_label
 
         self.wait(1)
 
         tracker = ValueTracker(8)
         self.clear()
-        relabel = AnimationGroup(hilbert_label[order].animate.scale(1.75).center().shift(UP * 2),
-                                 hilbertCurves[order].animate.scale(0.6).center().shift(DOWN + (RIGHT * 2)),
+        relabel = AnimationGroup(label.animate.scale(1.75).center().shift(UP * 2),
+                                 curve.animate.scale(0.6).center().shift(DOWN + (RIGHT * 2)),
                                  number_line.animate.scale(1.75).center().shift((LEFT * 3) + DOWN)
                                  )
-        self.add(hilbertCurves[order], hilbert_label[order], number_line)
+        self.add(curve, label, number_line)
         self.play(relabel)
 
-        changing_label = hilbert_label[order].copy()
+        changing_label = label.copy()
         changing_label.add_updater(lambda l: l.become(MathTex(r'H_{', str(int(tracker.get_value())),
                                                               r'}: [0, 1] \to [0, 1]^2')
                                                       .scale(1.2).move_to(l)))
 
-        self.remove(hilbert_label[order])
+        self.remove(label)
         self.add(changing_label)
 
         self.play(tracker.animate.set_value(100), run_time=1)
 
-        final_label = MathTex(r'H_{', r'\infty', r'}: [0, 1] \to [0, 1]^2').scale(1.2).move_to(hilbert_label[order])
-        numberLabels = Group(MathTex('0').align_to(hilbertCurves[order], DOWN).shift(DOWN * 0.5),
-                             MathTex('1').align_to(hilbertCurves[order], UP),
-                             MathTex('1').align_to(hilbertCurves[order], RIGHT).shift(DOWN * 3))
+        final_label = MathTex(r'H_{', r'\infty', r'}: [0, 1] \to [0, 1]^2').scale(1.2).move_to(label)
+        numberLabels = Group(MathTex('0').align_to(curve, DOWN).shift(DOWN * 0.5),
+                             MathTex('1').align_to(curve, UP),
+                             MathTex('1').align_to(curve, RIGHT).shift(DOWN * 3))
 
         self.play(TransformMatchingTex(changing_label, final_label), FadeIn(numberLabels), run_time=0.5)
-        # ValueTracker 0 to 1. represented by dot on dumber line. then measure 1/number of lines in hilbercurve. use them as spacings. all lines inat time t shine white\\
         arrow = Arrow(start=[-1, 0, 0], end=[1, 0, 0], tip_shape=ArrowTriangleFilledTip, stroke_width=3, color=BLUE_E)
         arrow.shift(DOWN + (LEFT * 0.5))
 
-        detailed_box = VGroup(hilbertCurves[order], *numberLabels)
+        detailed_box = VGroup(curve, *numberLabels)
 
         self.play(number_line.animate.shift(LEFT),
                   detailed_box.animate.shift(RIGHT),
@@ -433,7 +430,7 @@ class SpaceFillingCurveScene(ZoomedScene):
         self.play(FadeOut(detailed_box))
 
         rect = Rectangle(height=5.5, width=5.5, fill_opacity=0.9) \
-            .scale(0.6).move_to(hilbertCurves[order].get_center())
+            .scale(0.6).move_to(curve.get_center())
         rect.set_fill(color=[BLUE, YELLOW])
 
         self.play(TransformFromCopy(number_line, rect), FadeIn(numberLabels))
@@ -447,85 +444,24 @@ class SpaceFillingCurveScene(ZoomedScene):
         self.wait(0.5)
         # Show connection scene
 
-    def hilbertCurve(self, order=1, x_initial=0, y_initial=0,
-                     colors=[PURPLE_B, MAROON_B, BLUE_C, TEAL_C, YELLOW_C, GREEN_C, LIGHT_BROWN]):
+    def hilbertStages(self, order):
+        for i in range(order + 1):
+            curve = self.hilbertPolyline(order=i + 1)
+            curve.center().shift(UP * 0.5)
+            label = MathTex(r'H_', str(i + 1), r': [0, 1] \to [0, 1]^2').to_edge(DOWN).shift(RIGHT).scale(0.7)
+            yield curve, label
+
+    def hilbertPolyline(self, order=1, x_initial=0, y_initial=0,
+                        colors=[PURPLE_B, MAROON_B, BLUE_C, TEAL_C, YELLOW_C, GREEN_C, LIGHT_BROWN]):
+        # H_n as a handful of chunked paths, coloured along the gradient, instead of a Line per segment
         segment_length = 5 / (2 ** order)
         stroke_width = (-3 / 7) * order + (31 / 7)
-        segments = VGroup()
-
-        directions = self.hilbert(level=order)
-        prevCenter = np.array((x_initial, y_initial, 0.))
-
-        for direct in directions:
-            dirTranslate = UP
-            if direct == 'LEFT':
-                dirTranslate = LEFT
-            if direct == 'RIGHT':
-                dirTranslate = RIGHT
-            if direct == 'DOWN':
-                dirTranslate = DOWN
-
-            endPt = np.copy(prevCenter + (segment_length * dirTranslate))
-            segments.add(Line(start=prevCenter, end=endPt, stroke_width=stroke_width))
-            prevCenter = endPt
-
-        segments.set_color_by_gradient(*colors)
-
-        return segments
-
-    def hilbert(self, level=1, direction='UP'):
-        directions = []
-        if level == 1:
-            if direction == 'LEFT':
-                directions.append('RIGHT')
-                directions.append('DOWN')
-                directions.append('LEFT')
-            if direction == 'RIGHT':
-                directions.append('LEFT')
-                directions.append('UP')
-                directions.append('RIGHT')
-            if direction == 'UP':
-                directions.append('DOWN')
-                directions.append('RIGHT')
-                directions.append('UP')
-            if direction == 'DOWN':
-                directions.append('UP')
-                directions.append('LEFT')
-                directions.append('DOWN')
-        else:
-            if direction == 'LEFT':
-                directions.extend(self.hilbert(level - 1, 'UP'))
-                directions.append('RIGHT')
-                directions.extend(self.hilbert(level - 1, 'LEFT'))
-                directions.append('DOWN')
-                directions.extend(self.hilbert(level - 1, 'LEFT'))
-                directions.append('LEFT')
-                directions.extend(self.hilbert(level - 1, 'DOWN'))
-            if direction == 'RIGHT':
-                directions.extend(self.hilbert(level - 1, 'DOWN'))
-                directions.append('LEFT')
-                directions.extend(self.hilbert(level - 1, 'RIGHT'))
-                directions.append('UP')
-                directions.extend(self.hilbert(level - 1, 'RIGHT'))
-                directions.append('RIGHT')
-                directions.extend(self.hilbert(level - 1, 'UP'))
-            if direction == 'UP':
-                directions.extend(self.hilbert(level - 1, 'LEFT'))
-                directions.append('DOWN')
-                directions.extend(self.hilbert(level - 1, 'UP'))
-                directions.append('RIGHT')
-                directions.extend(self.hilbert(level - 1, 'UP'))
-                directions.append('UP')
-                directions.extend(self.hilbert(level - 1, 'RIGHT'))
-            if direction == 'DOWN':
-                directions.extend(self.hilbert(level - 1, 'RIGHT'))
-                directions.append('UP')
-                directions.extend(self.hilbert(level - 1, 'DOWN'))
-                directions.append('LEFT')
-                directions.extend(self.hilbert(level - 1, 'DOWN'))
-                directions.append('DOWN')
-                directions.extend(self.hilbert(level - 1, 'LEFT'))
-        return directions
+        _, num_chunks = chunk_layout(4 ** order - 1)
+
+        points, rgbs = cached_curve('hilbert', order, (x_initial, y_initial, 0), segment_length, colors, num_chunks,
+                                    lambda: hilbert_curve_points(order, x_initial, y_initial, segment_length))
+
+        return GradientPolyline(points, stroke_width=stroke_width).set_chunk_colors(rgbs)
 
 
 class ExtensionToR2Scene(SpaceFillingCurveScene):
@@ -548,9 +484,9 @@ class ExtensionToR2Scene(SpaceFillingCurveScene):
         ]
 
         curves = [
-            self.hilbertCurve(order = 4, colors=[BLUE, YELLOW]).scale((2 / 5)).center().set_z_index(3),
-            self.hilbertCurve(order = 5, colors=[RED, ORANGE]).scale((4 / 5)).center().set_z_index(2),
-            self.hilbertCurve(order = 6, colors=[PURPLE, BLUE]).scale((6 / 5)).center().set_z_index(1),
+            self.hilbertPolyline(order=4, colors=[BLUE, YELLOW]).scale((2 / 5)).center().set_z_index(3),
+            self.hilbertPolyline(order=5, colors=[RED, ORANGE]).scale((4 / 5)).center().set_z_index(2),
+            self.hilbertPolyline(order=6, colors=[PURPLE, BLUE]).scale((6 / 5)).center().set_z_index(1),
         ]
 
         left_corner_dots = [Dot(rectangles[i].get_corner(UL), color=GREEN_E, z_index=5) for i in range(4)]
@@ -558,7 +494,7 @@ class ExtensionToR2Scene(SpaceFillingCurveScene):
 
         self.add(rectangles[0], left_corner_dots[0], right_corner_dots[0])
 
-        function_labels = [
+        function_labels = batch_tex(lambda: [
             MathTex(r'H:[0, 1] \to', r' [', r'-1', r',', r' 1', r']^2').next_to(rectangles[0], DOWN),
             MathTex(r'H:[0, 1] \to', r' [', r'-1', r',', r' 1', r']^2').next_to(axes, DOWN, buff=-1.75).shift(LEFT * 4),
             MathTex(r'H:[0, 1] \to', r' [', r'-2', r',', r' 2', r']^2').next_to(axes, DOWN, buff=-1.75).shift(LEFT * 4),
@@ -566,7 +502,7 @@ class ExtensionToR2Scene(SpaceFillingCurveScene):
             MathTex(r'H:[0, 2] \to', r' [', r'-2', r',', r' 2', r']^2').next_to(axes, DOWN, buff=-1.75).shift(LEFT * 4),
             MathTex(r'H:[0, 3] \to', r' [', r'-3', r',', r' 3', r']^2').next_to(axes, DOWN, buff=-1.75).shift(LEFT * 4),
             MathTex(r'H:[0, \infty] \to', r' (', r'-\infty', r',', r' \infty', r')^2').scale(1.5)
-        ]
+        ])
         self.play(Write(function_labels[0]), FadeOut(left_corner_dots[0], right_corner_dots[0]), run_time=0.5)
 
         self.play(TransformMatchingTex(function_labels[0], function_labels[1]),
@@ -611,12 +547,12 @@ class ExtensionToR2Scene(SpaceFillingCurveScene):
                   FadeOut(rectangles[1], rectangles[2], rectangles[3], lines[0], lines[1], lines[2], axes))
 
         template = TexTemplate().add_to_preamble(r"\usepackage{amssymb}")
-        label = [
+        label = batch_tex(lambda: [
             Tex(r'$H: \mathbb R \to \mathbb R$', r'$^2$'),
             Tex(r'Onto', '?').shift(DOWN),
             Tex(r'Onto', '!').shift(DOWN),
             Tex(r'$H: \mathbb R \to \mathbb R$', r'$^3$')
-        ]
+        ])
         check = Tex(r'\checkmark', tex_template=template, color=GREEN_C).next_to(label[2], RIGHT)
 
         self.play(FadeIn(label[0], shift=UP), run_time=0.5)
@@ -628,7 +564,7 @@ class ExtensionToR2Scene(SpaceFillingCurveScene):
         self.wait()
 
 
-class SpaceFillingCurve3D(ThreeDScene):
+class SpaceFillingCurve3D(TexCacheMixin, ThreeDScene):
     def construct(self):
         self.set_camera_orientation(phi=70 * DEGREES, theta=45 * DEGREES)
         self.begin_ambient_camera_rotation(rate=0.25)
@@ -636,8 +572,6 @@ class SpaceFillingCurve3D(ThreeDScene):
         order = 5
         hilbertCurves = []
         for i in range(order):
-            timestamp = datetime.fromtimestamp(time.time())
-            print('Generating curve ', (i + 1), ' TIMESTAMP: ', timestamp)
             curve = self.hilbert3DCurve(order=i + 1)
             curve.center()
             hilbertCurves.append(curve)
@@ -652,90 +586,15 @@ class SpaceFillingCurve3D(ThreeDScene):
     def hilbert3DCurve(self, order=1, x_initial=0, y_initial=0):
         segment_length = 5 / (2 ** order)
         stroke_width = (-3 / 7) * order + (31 / 7)
-        segments = VGroup()
-
-        directions = self.hilbert3D(order=order)
-        prevCenter = np.array((x_initial, y_initial, 0.))
-
-        for direct in directions:
-            dirTranslate = UP
-            if direct == 'LEFT':
-                dirTranslate = LEFT
-            if direct == 'RIGHT':
-                dirTranslate = RIGHT
-            if direct == 'DOWN':
-                dirTranslate = DOWN
-            if direct == 'IN':
-                dirTranslate = IN
-            if direct == 'OUT':
-                dirTranslate = OUT
-
-            endPt = np.copy(prevCenter + (segment_length * dirTranslate))
-            segments.add(Line3D(start=prevCenter, end=endPt, stroke_width=stroke_width, resolution=2))
-            prevCenter = endPt
-
-        segments.set_color_by_gradient(PURPLE_B, MAROON_B, BLUE_C, TEAL_C, YELLOW_C, GREEN_C, LIGHT_BROWN)
-
-        return segments
-
-    def hilbert3D(self, order=1, cup_case=0):
-        # Each cup is 7 directions, which contains 8 cubes.
-        # To subdivide, we preserve all directions in starting cup,
-        # BUT, we add 8 cups at each corner, which cup we add depends
-        # on what we start with
-        cups = [
-            ['OUT', 'UP', 'IN', 'RIGHT', 'OUT', 'DOWN', 'IN'],  # 0
-            ['OUT', 'DOWN', 'IN', 'LEFT', 'OUT', 'UP', 'IN'],  # 1
-            ['IN', 'UP', 'OUT', 'LEFT', 'IN', 'DOWN', 'OUT'],  # 2
-            ['IN', 'DOWN', 'OUT', 'RIGHT', 'IN', 'UP', 'OUT'],  # 3
-            ['OUT', 'RIGHT', 'IN', 'UP', 'OUT', 'LEFT', 'IN'],  # 4
-            ['OUT', 'LEFT', 'IN', 'DOWN', 'OUT', 'RIGHT', 'IN'],  # 5
-            ['IN', 'LEFT', 'OUT', 'UP', 'IN', 'RIGHT', 'OUT'],  # 6
-            ['IN', 'RIGHT', 'OUT', 'DOWN', 'IN', 'LEFT', 'OUT'],  # 7
-            ['RIGHT', 'UP', 'LEFT', 'OUT', 'RIGHT', 'DOWN', 'LEFT'],  # 8
-            ['LEFT', 'DOWN', 'RIGHT', 'OUT', 'LEFT', 'UP', 'RIGHT'],  # 9
-            ['UP', 'LEFT', 'DOWN', 'IN', 'UP', 'RIGHT', 'DOWN'],  # 10
-            ['RIGHT', 'DOWN', 'LEFT', 'IN', 'RIGHT', 'UP', 'LEFT']  # 11
-        ]
-        if order == 1:
-            return cups[cup_case]
-        else:
-            if cup_case == 0:
-                sequence_of_cup_cases = [8, 4, 4, 3, 3, 5, 5, 10]
-            elif cup_case == 1:
-                sequence_of_cup_cases = [9, 5, 5, 2, 2, 4, 4, 11]
-            elif cup_case == 2:
-                sequence_of_cup_cases = [10, 6, 6, 1, 1, 7, 7, 8]
-            elif cup_case == 3:
-                sequence_of_cup_cases = [11, 7, 7, 0, 0, 6, 6, 9]
-            elif cup_case == 4:
-                sequence_of_cup_cases = [8, 0, 0, 6, 6, 1, 1, 11]
-            elif cup_case == 5:
-                sequence_of_cup_cases = [9, 1, 1, 7, 7, 0, 0, 10]
-            elif cup_case == 6:
-                sequence_of_cup_cases = [10, 2, 2, 4, 4, 3, 3, 9]
-            elif cup_case == 7:
-                sequence_of_cup_cases = [11, 3, 3, 5, 5, 2, 2, 8]
-            elif cup_case == 8:
-                sequence_of_cup_cases = [0, 4, 4, 9, 9, 7, 7, 2]
-            elif cup_case == 9:
-                sequence_of_cup_cases = [1, 5, 5, 8, 8, 6, 6, 3]
-            elif cup_case == 10:
-                sequence_of_cup_cases = [6, 2, 2, 11, 11, 0, 0, 5]
-            elif cup_case == 11:
-                sequence_of_cup_cases = [3, 7, 7, 10, 10, 4, 4, 1]
-
-            build = []
-            cup = cups[cup_case]
-            for i in range(8):
-                subCube = self.hilbert3D(order=order - 1, cup_case=sequence_of_cup_cases[i])
-                build.extend(subCube)
-                if i != 7:
-                    build.append(cup[i])
-
-            return build
-
-class FinalQuestionScene(Scene):
+        _, num_chunks = chunk_layout(8 ** order - 1)
+
+        colors = [PURPLE_B, MAROON_B, BLUE_C, TEAL_C, YELLOW_C, GREEN_C, LIGHT_BROWN]
+        points, rgbs = cached_curve('hilbert3D', order, (x_initial, y_initial, 0), segment_length, colors, num_chunks,
+                                    lambda: hilbert3d_curve_points(order, x_initial, y_initial, segment_length))
+
+        return TubePath(points, stroke_width=stroke_width).set_chunk_colors(rgbs)
+
+class FinalQuestionScene(TexCacheMixin, Scene):
     def construct(self):
         question = Tex(r'Can a ', 'continuous ', 'function ', r'$f$ ', r'$:$ ', r'$\mathbb R^2$', r'$ \to $',
                     r'$\mathbb R^3$', r' be onto?').set_color_by_gradient(BLUE, GREEN)
@@ -754,7 +613,7 @@ class FinalQuestionScene(Scene):
         self.play(FadeIn(left_arr))
         self.wait(2)
 
-class EmbededLineScene(ThreeDScene):
+class EmbededLineScene(TexCacheMixin, ThreeDScene):
     def construct(self):
         axes = ThreeDAxes(
             x_range=[-5, 5, 1],
@@ -843,21 +702,25 @@ class EmbededLineScene(ThreeDScene):
         self.play(ReplacementTransform(line2, cube))
         self.wait(2)
 
-class FurtherQuestionsScene(Scene):
+class FurtherQuestionsScene(TexCacheMixin, Scene):
     def construct(self):
         self.next_section()
         starter = Tex(r'There ', r'exists', r' a continuous',
                       r',', r' onto', r' function $\mathbb R^2 \to \mathbb R^3$', r'.', color=BLUE_B).shift(UP * 2)
-        second = Tex(r'There ', r'does ', r'not ', r'exist', r' a continuous', r',', r'\\', r' onto',
-                     r' and one-to-one', r' function $\mathbb R^2 \to \mathbb R^3$', r'.', color=BLUE_B).shift(UP * 2)
-        third = Tex(r'Why ', 'does ', 'there ', r'not ', r'exist', r' a continuous', r',', r'\\', r' onto',
-                     r' and one-to-one', r' function $\mathbb R^2 \to \mathbb R^3$', r'?', color=BLUE_B)
-
-        oto_lbl = Tex(r'one to one ', r' \, $\Leftrightarrow$ \,', r' non-crossing')\
-            .set_color_by_gradient(BLUE, BLUE_B).scale(1.5).to_edge(DOWN, buff=1.5)
+        # Built after starter so the two never compile the substrings they share at once
+        labels = TexFuture(lambda: [
+            Tex(r'There ', r'does ', r'not ', r'exist', r' a continuous', r',', r'\\', r' onto',
+                r' and one-to-one', r' function $\mathbb R^2 \to \mathbb R^3$', r'.', color=BLUE_B).shift(UP * 2),
+            Tex(r'Why ', 'does ', 'there ', r'not ', r'exist', r' a continuous', r',', r'\\', r' onto',
+                r' and one-to-one', r' function $\mathbb R^2 \to \mathbb R^3$', r'?', color=BLUE_B),
+            Tex(r'one to one ', r' \, $\Leftrightarrow$ \,', r' non-crossing')
+            .set_color_by_gradient(BLUE, BLUE_B).scale(1.5).to_edge(DOWN, buff=1.5),
+            Tex('Thanks for watching!', color=BLUE_C),
+        ])
 
         self.play(Write(starter), run_time=2)
         self.wait(3)
+        second, third, oto_lbl, thanks = labels.result()
         self.play(TransformMatchingTex(starter, second), run_time=2)
         self.play(Write(oto_lbl), run_time=2)
         #Show clip of hilbert curve and then connecting
@@ -867,6 +730,6 @@ class FurtherQuestionsScene(Scene):
         self.play(FadeOut(oto_lbl))
         self.play(TransformMatchingTex(second, third))
         self.wait(1)
-        thanks = Tex('Thanks for watching!', color=BLUE_C).next_to(third, DOWN, buff=1)
+        thanks.next_to(third, DOWN, buff=1)
         self.play(Write(thanks))
         self.wait(4)
@@ -0,0 +1,173 @@
+import hashlib
+import os
+import tempfile
+import zipfile
+from contextlib import contextmanager
+
+import svgelements as se
+
+from manim import *
+
+from mobjects import gradient_rgbs
+
+
+class GeometryCache:
+    """Content addressed .npz store, evicting least recently used files past max_bytes."""
+
+    def __init__(self, directory=None, max_bytes=512 * 1024 ** 2):
+        self.directory = directory or os.path.join(config.media_dir, 'geometry_cache')
+        self.max_bytes = max_bytes
+
+    def key(self, *parts):
+        return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.npz')
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+            # Touching the file is what marks it as recently used
+            os.utime(path)
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return None
+        return arrays
+
+    def put(self, key, arrays):
+        os.makedirs(self.directory, exist_ok=True)
+        # Write then rename, so a crashed or concurrent render never leaves half a file behind
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as file:
+            np.savez(file, **arrays)
+        os.replace(temp_path, self.path(key))
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.npz'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def fetch(self, key, build):
+        if config.disable_caching:
+            return build()
+
+        arrays = self.get(key)
+        if arrays is None:
+            arrays = build()
+            self.put(key, arrays)
+        return arrays
+
+
+curve_cache = GeometryCache()
+
+
+def cached_curve(curve_type, order, start, segment_length, colors, num_colors, build_vertices):
+    # Vertices plus num_colors gradient colours (as rgb rows) for a generated curve.
+    # build_vertices is only called when nothing is cached for these arguments.
+    key = curve_cache.key(curve_type, order, tuple(np.round(start, 6)), round(segment_length, 9),
+                          [str(color) for color in colors], num_colors)
+
+    def build():
+        return {
+            'vertices': np.asarray(build_vertices(), dtype=float),
+            'colors': gradient_rgbs(colors, num_colors),
+        }
+
+    arrays = curve_cache.fetch(key, build)
+    return arrays['vertices'], arrays['colors']
+
+
+tex_cache = GeometryCache(os.path.join(config.media_dir, 'tex_cache'), max_bytes=128 * 1024 ** 2)
+
+# What SVGMobject.generate_mobject turns the elements of a dvisvgm svg into, built empty so the
+# cached points and style can go straight in
+TEX_PART_TYPES = {
+    'VMobjectFromSVGPath': lambda tex: VMobjectFromSVGPath(se.Path(), **tex.path_string_config),
+    'Rectangle': lambda tex: Rectangle(),
+    'RoundedRectangle': lambda tex: RoundedRectangle(),
+}
+
+
+def tex_generate_mobject(tex):
+    # SVGMobject.generate_mobject for Tex and MathTex, going through tex_cache. The svg file
+    # name is already a hash of the LaTeX source with its template preamble; the outlines are
+    # stored before any scaling, so one entry serves every font size. Parts are rebuilt as the
+    # same classes with the same style the svg gives them; an svg with any other kind of part
+    # is parsed as usual every time.
+    key = tex_cache.key('tex parts', os.path.basename(str(tex.file_name)), tex.svg_default, tex.path_string_config)
+
+    def build():
+        SVGMobject.generate_mobject(tex)
+        parts = tex.submobjects
+        return {
+            'kinds': np.array([type(mob).__name__ for mob in parts], dtype=str),
+            'points': np.concatenate([mob.points for mob in parts]) if parts else np.zeros((0, 3)),
+            'lengths': np.array([len(mob.points) for mob in parts], dtype=int),
+            'fill_rgbas': np.array([mob.fill_rgbas[0] for mob in parts]).reshape(-1, 4),
+            'stroke_rgbas': np.array([mob.stroke_rgbas[0] for mob in parts]).reshape(-1, 4),
+            'stroke_widths': np.array([mob.stroke_width for mob in parts], dtype=float),
+        }
+
+    arrays = tex_cache.fetch(key, build)
+    if tex.submobjects:
+        # Just built from the svg
+        return
+    if not all(kind in TEX_PART_TYPES for kind in arrays['kinds']):
+        SVGMobject.generate_mobject(tex)
+        return
+    ends = np.cumsum(arrays['lengths'])
+    for kind, end, length, fill, stroke, width in zip(arrays['kinds'], ends, arrays['lengths'], arrays['fill_rgbas'],
+                                                      arrays['stroke_rgbas'], arrays['stroke_widths']):
+        mob = TEX_PART_TYPES[kind](tex)
+        mob.set_points(arrays['points'][end - length:end])
+        # What SVGMobject.apply_style_to_mobject leaves behind
+        mob.fill_rgbas = fill[None, :]
+        mob.stroke_rgbas = stroke[None, :]
+        mob.stroke_width = width
+        tex.add(mob)
+
+
+@contextmanager
+def tex_geometry_cache():
+    # Every Tex and MathTex built inside the block, including the ones manim makes itself for
+    # matrix entries and axis numbers, loads its parsed outlines from tex_cache instead of the svg
+    own = vars(SingleStringMathTex).get('generate_mobject')
+    SingleStringMathTex.generate_mobject = tex_generate_mobject
+    try:
+        yield
+    finally:
+        if own is None:
+            # Back to the one inherited from SVGMobject
+            del SingleStringMathTex.generate_mobject
+        else:
+            SingleStringMathTex.generate_mobject = own
+
+
+class TexCacheMixin:
+    """Renders a scene with tex_geometry_cache on, e.g. class IntroScene(TexCacheMixin, Scene).
+
+    Nothing outside the render is affected, so importing a scene module changes no Tex.
+    """
+
+    def render(self, preview=False):
+        with tex_geometry_cache():
+            return super().render(preview)
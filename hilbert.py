@@ -0,0 +1,125 @@
+from functools import lru_cache
+
+import numpy as np
+
+
+def hilbert_xy(order, index):
+    # Vertex number index of the order n curve, in unit steps, starting at the origin and
+    # opening upward (same path the old recursive 'UP' direction list traced, checked
+    # vertex for vertex for orders 1 to 6).
+    # Usual d2xy bit twiddling, so O(order) for a single index and vectorized over arrays.
+    t = np.array(index, dtype=int)
+    x = np.zeros_like(t)
+    y = np.zeros_like(t)
+    s = 1
+    while s < 2 ** order:
+        rx = 1 & (t // 2)
+        ry = 1 & (t ^ rx)
+        flip = (ry == 0) & (rx == 1)
+        x = np.where(flip, s - 1 - x, x)
+        y = np.where(flip, s - 1 - y, y)
+        swap = ry == 0
+        x, y = np.where(swap, y, x), np.where(swap, x, y)
+        x += s * rx
+        y += s * ry
+        t //= 4
+        s *= 2
+
+    return np.stack([x, -y, np.zeros_like(x)], axis=-1).astype(float)
+
+
+@lru_cache(maxsize=None)
+def hilbert_vertices(order=1):
+    vertices = hilbert_xy(order, np.arange(4 ** order))
+    # Memoized, so hand out a read only array
+    vertices.flags.writeable = False
+    return vertices
+
+
+def hilbert_segment(t, order=1):
+    # (segment index, fraction along that segment) for the parameter t in [0, 1] on H_n.
+    # Every segment has the same length, so t is spread evenly over them.
+    position = np.clip(t, 0, 1) * (4 ** order - 1)
+    index = np.minimum(np.floor(position).astype(int), 4 ** order - 2)
+    return index, position - index
+
+
+def hilbert_point(t, order=1, x_initial=0, y_initial=0, segment_length=None):
+    # Point H_n(t), without generating the rest of the curve
+    if segment_length is None:
+        segment_length = 5 / (2 ** order)
+    index, fraction = hilbert_segment(t, order)
+    start = hilbert_xy(order, index)
+    end = hilbert_xy(order, index + 1)
+    unit = start + np.expand_dims(fraction, -1) * (end - start)
+    return unit * segment_length + np.array((x_initial, y_initial, 0.))
+
+
+def hilbert_curve_points(order=1, x_initial=0, y_initial=0, segment_length=None):
+    if segment_length is None:
+        segment_length = 5 / (2 ** order)
+    return hilbert_vertices(order) * segment_length + np.array((x_initial, y_initial, 0.))
+
+
+# Each cup is 7 directions, which contains 8 cubes.
+# To subdivide, we preserve all directions in starting cup,
+# BUT, we add 8 cups at each corner, which cup we add depends
+# on what we start with (CUP_CHILDREN_3D[cup]).
+STEPS_3D = ['RIGHT', 'LEFT', 'UP', 'DOWN', 'OUT', 'IN']
+STEP_VECTORS_3D = np.array([(1., 0., 0.), (-1., 0., 0.), (0., 1., 0.), (0., -1., 0.), (0., 0., 1.), (0., 0., -1.)])
+CUPS_3D = np.array([[STEPS_3D.index(step) for step in cup] for cup in [
+    ['OUT', 'UP', 'IN', 'RIGHT', 'OUT', 'DOWN', 'IN'],  # 0
+    ['OUT', 'DOWN', 'IN', 'LEFT', 'OUT', 'UP', 'IN'],  # 1
+    ['IN', 'UP', 'OUT', 'LEFT', 'IN', 'DOWN', 'OUT'],  # 2
+    ['IN', 'DOWN', 'OUT', 'RIGHT', 'IN', 'UP', 'OUT'],  # 3
+    ['OUT', 'RIGHT', 'IN', 'UP', 'OUT', 'LEFT', 'IN'],  # 4
+    ['OUT', 'LEFT', 'IN', 'DOWN', 'OUT', 'RIGHT', 'IN'],  # 5
+    ['IN', 'LEFT', 'OUT', 'UP', 'IN', 'RIGHT', 'OUT'],  # 6
+    ['IN', 'RIGHT', 'OUT', 'DOWN', 'IN', 'LEFT', 'OUT'],  # 7
+    ['RIGHT', 'UP', 'LEFT', 'OUT', 'RIGHT', 'DOWN', 'LEFT'],  # 8
+    ['LEFT', 'DOWN', 'RIGHT', 'OUT', 'LEFT', 'UP', 'RIGHT'],  # 9
+    ['UP', 'LEFT', 'DOWN', 'IN', 'UP', 'RIGHT', 'DOWN'],  # 10
+    ['RIGHT', 'DOWN', 'LEFT', 'IN', 'RIGHT', 'UP', 'LEFT'],  # 11
+]], dtype=np.int8)
+CUP_CHILDREN_3D = np.array([
+    [8, 4, 4, 3, 3, 5, 5, 10],
+    [9, 5, 5, 2, 2, 4, 4, 11],
+    [10, 6, 6, 1, 1, 7, 7, 8],
+    [11, 7, 7, 0, 0, 6, 6, 9],
+    [8, 0, 0, 6, 6, 1, 1, 11],
+    [9, 1, 1, 7, 7, 0, 0, 10],
+    [10, 2, 2, 4, 4, 3, 3, 9],
+    [11, 3, 3, 5, 5, 2, 2, 8],
+    [0, 4, 4, 9, 9, 7, 7, 2],
+    [1, 5, 5, 8, 8, 6, 6, 3],
+    [6, 2, 2, 11, 11, 0, 0, 5],
+    [3, 7, 7, 10, 10, 4, 4, 1],
+])
+
+
+@lru_cache(maxsize=None)
+def hilbert3d_vertices(order=1, cup_case=0):
+    # Step codes for every cup state at once, one level at a time: the steps of a state
+    # are its 8 children's steps with its own cup steps stitched in between. Matches the old
+    # recursive hilbert3D step for step, for every cup_case at orders 1 to 5.
+    steps = CUPS_3D
+    for _ in range(order - 1):
+        length = steps.shape[1]
+        refined = np.empty((len(CUPS_3D), 8 * length + 7), dtype=np.int8)
+        for i in range(8):
+            start = i * (length + 1)
+            refined[:, start:start + length] = steps[CUP_CHILDREN_3D[:, i]]
+            if i < 7:
+                refined[:, start + length] = CUPS_3D[:, i]
+        steps = refined
+
+    vertices = np.zeros((steps.shape[1] + 1, 3))
+    np.cumsum(STEP_VECTORS_3D[steps[cup_case]], axis=0, out=vertices[1:])
+    vertices.flags.writeable = False
+    return vertices
+
+
+def hilbert3d_curve_points(order=1, x_initial=0, y_initial=0, segment_length=None):
+    if segment_length is None:
+        segment_length = 5 / (2 ** order)
+    return hilbert3d_vertices(order) * segment_length + np.array((x_initial, y_initial, 0.))
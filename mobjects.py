@@ -0,0 +1,435 @@
+from collections import OrderedDict
+
+from manim import *
+
+from parametric import chord_distances
+
+
+def polyline_points(vertices):
+    # Bezier points for straight segments between consecutive vertices, laid out exactly
+    # like VMobject.set_points_as_corners does it, for every segment at once.
+    vertices = np.asarray(vertices, dtype=float)
+    starts, ends = vertices[:-1], vertices[1:]
+    alphas = np.linspace(0, 1, 4)[None, :, None]
+    return (starts[:, None, :] + alphas * (ends - starts)[:, None, :]).reshape(-1, 3)
+
+
+def gradient_rgbs(colors, length):
+    # Same colours as color_gradient(colors, length), as a (length, 3) rgb array built with
+    # one np.interp per channel instead of a Color object per entry.
+    stops = np.array([color_to_rgb(color) for color in colors])
+    if len(stops) == 1:
+        return np.repeat(stops, length, axis=0)
+    alphas = np.linspace(0, len(stops) - 1, length)
+    return np.stack([np.interp(alphas, np.arange(len(stops)), channel) for channel in stops.T], axis=1)
+
+
+def set_rgbs(mobjects, rgbs):
+    # set_color(color, family=False) on each VMobject, writing the rgb rows straight into
+    # the existing stroke and fill arrays so opacities are left alone.
+    for mob, rgb in zip(mobjects, rgbs):
+        mob.stroke_rgbas[:, :3] = rgb
+        mob.fill_rgbas[:, :3] = rgb
+
+
+def chunk_layout(num_segments, num_chunks=256):
+    # (segments per chunk, number of chunks) when splitting a polyline into about num_chunks pieces
+    chunk_size = int(np.ceil(num_segments / min(num_chunks, num_segments)))
+    return chunk_size, int(np.ceil(num_segments / chunk_size))
+
+
+class GradientPolyline(VGroup):
+    """A long polyline split into a few VMobject chunks instead of one Line per segment.
+
+    Each chunk gets one colour of the gradient, so with enough chunks it looks like
+    calling set_color_by_gradient on a VGroup of Lines.
+    """
+
+    def __init__(self, vertices, colors=None, num_chunks=256, stroke_width=DEFAULT_STROKE_WIDTH, **kwargs):
+        super().__init__(**kwargs)
+        self.chunk_size, count = chunk_layout(len(vertices) - 1, num_chunks)
+        self.add(*[VMobject(stroke_width=stroke_width) for _ in range(count)])
+
+        self.set_vertices(vertices)
+        if colors is not None:
+            self.set_color_by_gradient(*colors)
+
+    def set_color_by_gradient(self, *colors):
+        return self.set_chunk_colors(gradient_rgbs(colors, len(self.submobjects)))
+
+    def chunk_slices(self):
+        step = 4 * self.chunk_size
+        return [slice(i * step, (i + 1) * step) for i in range(len(self.submobjects))]
+
+    def set_vertices(self, vertices):
+        points = polyline_points(vertices)
+        for chunk, part in zip(self.submobjects, self.chunk_slices()):
+            chunk.set_points(points[part])
+        return self
+
+    def get_vertices(self):
+        # Chunks share their boundary vertex, so every segment start plus the final end
+        starts = [chunk.points[::4] for chunk in self.submobjects]
+        return np.concatenate(starts + [self.submobjects[-1].points[-1:]])
+
+    def set_chunk_colors(self, rgbs):
+        set_rgbs(self.submobjects, rgbs)
+        return self
+
+
+class TubePath(GradientPolyline):
+    """GradientPolyline for 3D scenes, standing in for a VGroup of Line3D cylinders.
+
+    Each chunk is drawn as a stroke over a darker, wider background stroke, which reads as a
+    shaded tube. Chunks are shaded in 3D, so the camera depth sorts them like any surface.
+    """
+
+    def __init__(self, vertices, colors=None, num_chunks=256, stroke_width=DEFAULT_STROKE_WIDTH, outline_ratio=1.8,
+                 **kwargs):
+        self.outline_ratio = outline_ratio
+        super().__init__(vertices, colors=colors, num_chunks=num_chunks, stroke_width=stroke_width, **kwargs)
+        self.set_shade_in_3d(True)
+        self.add_outline()
+
+    def add_outline(self):
+        for chunk in self.submobjects:
+            # 60% of the way to black, like interpolate_color(color, BLACK, 0.6)
+            chunk.set_stroke(width=self.outline_ratio * chunk.get_stroke_width(), background=True)
+            chunk.background_stroke_rgbas[:, :3] = 0.4 * chunk.stroke_rgbas[0, :3]
+        return self
+
+    def set_chunk_colors(self, rgbs):
+        super().set_chunk_colors(rgbs)
+        return self.add_outline()
+
+
+class BoundedTracedPath(VMobject):
+    """TracedPath whose size stays bounded however long it runs.
+
+    Vertices live in a ring buffer of max_vertices, oldest dropped first. The last vertex
+    follows the traced point, and the one before it is only kept as a corner once one of
+    the points traced since then would sit more than tolerance off the straight segment.
+    With dissipating_time, vertices older than that are dropped from the tail.
+    """
+
+    def __init__(self, traced_point_func, stroke_width=2, stroke_color=WHITE, max_vertices=1024, tolerance=0.002,
+                 max_pending=64, dissipating_time=None, **kwargs):
+        super().__init__(stroke_color=stroke_color, stroke_width=stroke_width, **kwargs)
+        self.traced_point_func = traced_point_func
+        self.max_vertices = max_vertices
+        self.tolerance = tolerance
+        self.dissipating_time = dissipating_time
+        self.vertices = np.zeros((max_vertices, 3))
+        self.times = np.zeros(max_vertices)
+        self.start = 0
+        self.count = 0
+        # Points traced since the last corner, which the segment ending at the live vertex must stay close to
+        self.pending = np.zeros((max_pending, 3))
+        self.pending_count = 0
+        self.time = 0
+        self.add_updater(self.update_path)
+
+    def index(self, i):
+        return (self.start + i) % self.max_vertices
+
+    def push(self, point):
+        if self.count == self.max_vertices:
+            self.start = self.index(1)
+            self.count -= 1
+        self.vertices[self.index(self.count)] = point
+        self.times[self.index(self.count)] = self.time
+        self.count += 1
+
+    def update_path(self, mob, dt):
+        self.time += dt
+        point = np.array(self.traced_point_func(), dtype=float)
+        if self.count < 2:
+            self.push(point)
+        else:
+            corner = self.vertices[self.index(self.count - 2)]
+            pending = self.pending[:self.pending_count]
+            chord_start = np.broadcast_to(corner, pending.shape)
+            chord_end = np.broadcast_to(point, pending.shape)
+            if self.pending_count == len(self.pending) or \
+                    np.any(chord_distances(chord_start, pending, chord_end) > self.tolerance):
+                # The live vertex becomes a corner, and a new live vertex starts from it
+                self.pending_count = 0
+                self.push(point)
+            else:
+                self.vertices[self.index(self.count - 1)] = point
+                self.times[self.index(self.count - 1)] = self.time
+        self.pending[self.pending_count] = point
+        self.pending_count += 1
+
+        if self.dissipating_time:
+            while self.count > 1 and self.time - self.times[self.start] > self.dissipating_time:
+                self.start = self.index(1)
+                self.count -= 1
+
+        self.set_points(polyline_points(self.vertices[self.index(np.arange(self.count))]))
+
+
+def direction_frame(direction):
+    # Rotation matrix whose columns are two unit vectors perpendicular to direction, then direction itself
+    length = np.linalg.norm(direction)
+    z = direction / length if length > 0 else OUT
+    helper = OUT if abs(z[2]) < 0.9 else RIGHT
+    x = normalize(np.cross(helper, z))
+    return np.column_stack([x, np.cross(z, x), z])
+
+
+class RetargetableArrow3D(Arrow3D):
+    """Arrow3D that can be moved to a new start and end without being rebuilt.
+
+    The mesh is stored once in the arrow's own frame, with the shaft starting at the origin
+    and pointing along z. put_start_and_end_on stretches the shaft, slides the tip along to
+    the new end and rotates everything into place with one matrix product, instead of
+    building a new cylinder and cone for become(Arrow3D(...)).
+    """
+
+    def __init__(self, start=LEFT, end=RIGHT, height=0.3, **kwargs):
+        super().__init__(start=start, end=end, height=height, **kwargs)
+        self.tip_height = height
+
+        family = self.family_members_with_points()
+        tip_members = self.cone.family_members_with_points()
+        ends = np.cumsum([len(mob.points) for mob in family])
+        self.mesh_slices = [slice(end - len(mob.points), end) for mob, end in zip(family, ends)]
+        self.mesh = (np.concatenate([mob.points for mob in family]) - self.start) @ direction_frame(self.direction)
+        is_tip = np.concatenate([np.full(len(mob.points), mob in tip_members) for mob in family])
+        self.shaft_indices = np.flatnonzero(~is_tip)
+        self.tip_indices = np.flatnonzero(is_tip)
+        self.mesh_length = self.length
+
+    def put_start_and_end_on(self, start, end):
+        start = np.array(start, dtype=float)
+        vect = np.array(end, dtype=float) - start
+        if np.linalg.norm(vect) > 0:
+            self.direction = normalize(vect)
+        # Same layout Arrow3D builds: shaft up to end - height * direction, tip from there to end
+        self.length = np.linalg.norm(vect) - self.tip_height
+
+        local = self.mesh.copy()
+        local[self.shaft_indices, 2] *= self.length / self.mesh_length
+        local[self.tip_indices, 2] += self.length - self.mesh_length
+        points = local @ direction_frame(self.direction).T + start
+        for mob, part in zip(self.family_members_with_points(), self.mesh_slices):
+            mob.points = points[part]
+
+        self.start = start
+        self.vect = self.length * self.direction
+        self.end = start + self.vect
+        return self
+
+
+class MatrixFactory:
+    """LRU cache of Matrix mobjects keyed on their entries and style.
+
+    Matrix typesets every entry through MathTex, even though per frame readouts only ever
+    show a few hundred distinct rounded values. Calling the factory returns a copy of a
+    prebuilt Matrix when it has one, and hits / misses tell how well max_size fits.
+    Keyword arguments given to the factory itself are defaults for every Matrix it builds.
+    """
+
+    def __init__(self, max_size=512, **defaults):
+        self.max_size = max_size
+        self.defaults = defaults
+        self.matrices = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        return self.hits / max(self.hits + self.misses, 1)
+
+    def __call__(self, rows, row_colors=None, **kwargs):
+        kwargs = {**self.defaults, **kwargs}
+        # Entries are keyed on str, which is also what Matrix typesets
+        key = (tuple(tuple(str(entry) for entry in row) for row in rows), row_colors,
+               tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+        if key in self.matrices:
+            self.hits += 1
+            self.matrices.move_to_end(key)
+        else:
+            self.misses += 1
+            matrix = Matrix(rows, **kwargs)
+            if row_colors is not None:
+                matrix.set_row_colors(*row_colors)
+            self.matrices[key] = matrix
+            if len(self.matrices) > self.max_size:
+                self.matrices.popitem(last=False)
+        return self.matrices[key].copy()
+
+
+class GlyphAtlas:
+    """Points of single characters typeset once per font size.
+
+    Each character goes through SingleStringMathTex the first time it is asked for, after
+    that its outline is just an array, moved so its bounding box starts at the origin.
+    Colour lives on the mobject the points are copied into, so it isn't part of the key.
+    """
+
+    def __init__(self):
+        self.glyphs = {}
+
+    def glyph(self, char, font_size=DEFAULT_FONT_SIZE):
+        # (points, width, height) of char, with its lower left corner at the origin
+        key = (char, font_size)
+        if key not in self.glyphs:
+            tex = SingleStringMathTex(char, font_size=font_size)
+            members = tex.family_members_with_points()
+            points = np.concatenate([mob.points for mob in members]) if members else np.zeros((0, 3))
+            if len(points):
+                points = points - np.append(points[:, :2].min(axis=0), 0)
+            points.flags.writeable = False
+            width, height = np.ptp(points[:, :2], axis=0) if len(points) else (0., 0.)
+            self.glyphs[key] = (points, width, height)
+        return self.glyphs[key]
+
+
+glyph_atlas = GlyphAtlas()
+
+
+class GlyphString(VMobject):
+    """A short string of characters laid out from the glyph atlas, one submobject each.
+
+    Lays characters out the way DecimalNumber arranges its digits, bottoms aligned with a
+    small gap, so it can stand in for it or for the MathTex entries of a numeric Matrix.
+    set_text writes new points into the same submobjects instead of copying, scaling and
+    rearranging mobjects, keeping edge_to_fix where it was and any scaling applied since.
+    """
+
+    def __init__(self, text='', font_size=DEFAULT_FONT_SIZE, digit_buff_per_font_unit=0.001, edge_to_fix=LEFT,
+                 stroke_width=0, fill_opacity=1.0, **kwargs):
+        super().__init__(stroke_width=stroke_width, fill_opacity=fill_opacity, **kwargs)
+        self.font_size = font_size
+        self.buff = digit_buff_per_font_unit * font_size
+        self.edge_to_fix = edge_to_fix
+        self.pool = []
+        self.text = None
+        self.natural_width = 0
+        self.set_text(text, fix_edge=False)
+        self.move_to(ORIGIN)
+
+    def layout(self, text):
+        # Points of every character in text, placed like DecimalNumber places its parts
+        glyphs = [glyph_atlas.glyph(char, self.font_size) for char in text]
+        lefts = np.cumsum([0] + [width + self.buff for _, width, _ in glyphs[:-1]])
+        bottoms = np.zeros(len(glyphs))
+        for i, char in enumerate(text):
+            if char == '-' and i + 1 < len(text):
+                # Top of the minus level with the middle of what follows it
+                bottoms[i] = glyphs[i + 1][2] / 2 - glyphs[i][2]
+            elif char == ',':
+                bottoms[i] = -glyphs[i][2] / 2
+        return [points + (left, bottom, 0) for (points, _, _), left, bottom in zip(glyphs, lefts, bottoms)]
+
+    def get_scale(self):
+        # How far the text was scaled since it was laid out at font_size. Read off the current
+        # width, the way DecimalNumber reads its font size off its height, so scaling through an
+        # animation counts as well as calling scale.
+        if not self.submobjects or self.natural_width == 0:
+            return 1
+        return self.width / self.natural_width
+
+    def set_text(self, text, fix_edge=True):
+        text = str(text)
+        if text == self.text:
+            return self
+        scale = self.get_scale()
+        anchor = self.get_edge_center(self.edge_to_fix) if fix_edge and self.submobjects else None
+        self.text = text
+
+        while len(self.pool) < len(text):
+            self.pool.append(VMobject())
+        old_count = len(self.submobjects)
+        parts = self.layout(text)
+        xs = np.concatenate([points[:, 0] for points in parts]) if parts else []
+        self.natural_width = np.ptp(xs) if len(xs) else 0
+        for mob, points in zip(self.pool, parts):
+            mob.set_points(points * scale)
+        for mob in self.pool[len(text):]:
+            # The Cairo renderer can still be drawing dropped submobjects this frame
+            mob.clear_points()
+        self.submobjects = self.pool[:len(text)]
+        for mob in self.submobjects[old_count:]:
+            mob.match_style(self, family=False)
+
+        if anchor is not None and self.submobjects:
+            self.move_to(anchor, self.edge_to_fix)
+        return self
+
+
+class GlyphDecimalNumber(GlyphString):
+    """DecimalNumber built from the glyph atlas, for readouts that change every frame."""
+
+    def __init__(self, number=0, num_decimal_places=2, include_sign=False, group_with_commas=True, **kwargs):
+        self.num_decimal_places = num_decimal_places
+        self.include_sign = include_sign
+        self.group_with_commas = group_with_commas
+        self.number = number
+        super().__init__(self.num_string(number), **kwargs)
+
+    def num_string(self, number):
+        # Same formatting as DecimalNumber, including no sign on values that round to zero
+        formatter = '{:' + ('+' if self.include_sign else '') + (',' if self.group_with_commas else '') + \
+                    '.' + str(self.num_decimal_places) + 'f}'
+        num_string = formatter.format(number)
+        if num_string.startswith('-') and np.round(number, self.num_decimal_places) == 0:
+            num_string = ('+' if self.include_sign else '') + num_string[1:]
+        return num_string
+
+    def set_value(self, number):
+        self.number = number
+        return self.set_text(self.num_string(number))
+
+    def get_value(self):
+        return self.number
+
+    def increment_value(self, delta_t=1):
+        return self.set_value(self.get_value() + delta_t)
+
+
+class CulledScroll(VGroup):
+    """A tall mobject that scrolls past a static camera, drawing only what is in frame.
+
+    The outlines of mobject (typically a Tex) are flattened into submobjects and kept as
+    they were at offset zero. scroll_to moves the parts that overlap the frame, widened by
+    margin, and empties the points of the rest, which the camera skips without drawing.
+    Each frame then only touches the visible parts, however long the content runs. Move
+    it with scroll_to rather than shift or animate, since empty parts don't follow along.
+    """
+
+    def __init__(self, mobject, margin=0.5, **kwargs):
+        super().__init__(**kwargs)
+        parts = mobject.family_members_with_points()
+        self.base_points = [part.points.copy() for part in parts]
+        self.lower_corners = np.array([points.min(axis=0) for points in self.base_points])
+        self.upper_corners = np.array([points.max(axis=0) for points in self.base_points])
+        self.margin = margin
+        for part in parts:
+            part.submobjects = []
+        self.add(*parts)
+        self.visible = np.ones(len(parts), dtype=bool)
+        self.offset = None
+        self.scroll_to(ORIGIN)
+
+    def scroll_to(self, offset):
+        offset = np.array(offset, dtype=float)
+        if self.offset is not None and np.array_equal(offset, self.offset):
+            return self
+        self.offset = offset
+
+        frame_radius = np.array([config.frame_x_radius + self.margin, config.frame_y_radius + self.margin, np.inf])
+        visible = np.all((self.lower_corners + offset < frame_radius) & (self.upper_corners + offset > -frame_radius),
+                         axis=1)
+        for i in np.flatnonzero(visible):
+            self.submobjects[i].points = self.base_points[i] + offset
+        for i in np.flatnonzero(self.visible & ~visible):
+            self.submobjects[i].clear_points()
+        self.visible = visible
+        return self
+
+
+# Readout matrices only hold short numbers, which the glyph atlas lays out without LaTeX
+matrix_factory = MatrixFactory(element_to_mobject=GlyphString)
@@ -0,0 +1,155 @@
+from manim import *
+
+
+def sample_function(function, ts):
+    # function evaluated at every t in ts as an (N, 3) array. Tries a single call with the
+    # whole array first (accepting (N, 3) or (3, N) output), checks it against plain calls at
+    # a few t, and falls back to one call per t when the function isn't array safe.
+    ts = np.asarray(ts, dtype=float)
+    try:
+        with np.errstate(all='ignore'):
+            points = np.asarray(function(ts), dtype=float)
+    except (TypeError, ValueError, IndexError):
+        points = None
+
+    if points is not None:
+        checks = np.unique([0, len(ts) // 2, len(ts) - 1])
+        expected = np.array([function(t) for t in ts[checks]], dtype=float)
+        for candidate in (points, points.T):
+            if candidate.shape == (len(ts), 3) and np.allclose(candidate[checks], expected, equal_nan=True):
+                return candidate
+
+    return np.array([function(t) for t in ts], dtype=float)
+
+
+def turning_angles(before, at, after):
+    # Angle the polyline before -> at -> after turns by at each middle point
+    incoming, outgoing = at - before, after - at
+    with np.errstate(all='ignore'):
+        cos = np.sum(incoming * outgoing, axis=1) / (np.linalg.norm(incoming, axis=1) * np.linalg.norm(outgoing, axis=1))
+    return np.arccos(np.clip(np.nan_to_num(cos, nan=1), -1, 1))
+
+
+def chord_distances(before, at, after):
+    # Distance from each point at to the segment before -> after
+    chord = after - before
+    length_sq = np.sum(chord * chord, axis=1)
+    with np.errstate(all='ignore'):
+        alpha = np.clip(np.nan_to_num(np.sum((at - before) * chord, axis=1) / length_sq), 0, 1)
+    return np.linalg.norm(at - (before + alpha[:, None] * chord), axis=1)
+
+
+def refine_samples(function, ts, tolerance=0.005, max_angle=10 * DEGREES, max_depth=8):
+    # Starting from the t grid ts, halves every interval where the curve at a quarter, half or
+    # three quarters of the way along is more than tolerance away from the same point on the
+    # chord (about curvature * length^2 / 8 on a smooth curve), or where it turns by more than
+    # max_angle, up to max_depth times. The quarter points catch intervals that straddle an
+    # inflection, whose midpoint lands on the chord. That error is also how far interpolating
+    # linearly in t lands from function(t), so the (ts, points) returned work as a lookup table
+    # from t to a point as well as a polyline.
+    ts = np.asarray(ts, dtype=float)
+    points = sample_function(function, ts)
+
+    candidates = np.arange(len(ts) - 1)
+    for _ in range(max_depth):
+        if len(candidates) == 0:
+            break
+        before, after = points[candidates], points[candidates + 1]
+        probes = []
+        for fraction in (0.25, 0.5, 0.75):
+            probe_ts = ts[candidates] + fraction * (ts[candidates + 1] - ts[candidates])
+            probe_points = sample_function(function, probe_ts)
+            error = np.linalg.norm(probe_points - (before + fraction * (after - before)), axis=1)
+            probes.append((probe_ts, probe_points, error))
+        mid_ts, mid_points, _ = probes[1]
+        split = (np.max([error for _, _, error in probes], axis=0) > tolerance) | \
+                (turning_angles(before, mid_points, after) > max_angle)
+
+        candidates = candidates[split]
+        ts = np.insert(ts, candidates + 1, mid_ts[split])
+        points = np.insert(points, candidates + 1, mid_points[split], axis=0)
+        # Both halves of every split interval get checked again
+        first_halves = candidates + np.arange(len(candidates))
+        candidates = np.stack([first_halves, first_halves + 1], axis=1).ravel()
+
+    return ts, points
+
+
+def adaptive_samples(function, ts, tolerance=0.005, max_angle=10 * DEGREES, max_depth=8):
+    # refine_samples, after which samples that sit within tolerance / 2 of the chord between
+    # their neighbours are dropped again, so smooth stretches end up with few points. That only
+    # keeps the shape within tolerance: the t of a point is no longer interpolated, so use
+    # refine_samples for a lookup table. Returns the final (ts, points).
+    ts, points = refine_samples(function, ts, tolerance, max_angle, max_depth)
+
+    idle_passes = 0
+    for i in range(2 * max_depth):
+        # Alternate between odd and even samples so no two neighbours go in the same pass
+        inner = np.arange(1 + i % 2, len(ts) - 1, 2)
+        removable = (chord_distances(points[inner - 1], points[inner], points[inner + 1]) < tolerance / 2) & \
+                    (turning_angles(points[inner - 1], points[inner], points[inner + 1]) < max_angle)
+        idle_passes = 0 if removable.any() else idle_passes + 1
+        if idle_passes == 2:
+            break
+        keep = np.ones(len(ts), dtype=bool)
+        keep[inner[removable]] = False
+        ts, points = ts[keep], points[keep]
+
+    return ts, points
+
+
+class VectorizedParametricFunction(ParametricFunction):
+    """ParametricFunction that samples the whole t range with one call when it can.
+
+    The function should accept an array of t and return (N, 3) or (3, N) points, the same
+    way np.sin does. Functions that only work one t at a time still plot, just slower.
+
+    With adaptive=True the t_range step is only the starting grid: it gets refined where
+    the curve bends or oscillates and thinned where it is close to straight, keeping the
+    drawn curve within tolerance (in scene units) of the function. Create and other partial
+    animations still draw it at an even pace in t, as they would on the uniform grid, so
+    get_end() keeps step with a tracker running over t_range alongside.
+    """
+
+    def __init__(self, function, t_range=None, adaptive=False, tolerance=0.005, **kwargs):
+        self.adaptive = adaptive
+        self.tolerance = tolerance
+        super().__init__(function, t_range=t_range, **kwargs)
+
+    def generate_points(self):
+        if self.discontinuities is not None:
+            discontinuities = np.array([t for t in self.discontinuities if self.t_min <= t <= self.t_max])
+            boundary_times = np.sort([self.t_min, self.t_max, *(discontinuities - self.dt),
+                                      *(discontinuities + self.dt)])
+        else:
+            boundary_times = [self.t_min, self.t_max]
+
+        # t of every corner, against the index of the curve it starts (paths follow on from each other)
+        knot_ts, knot_curves = [], []
+        for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
+            ts = np.append(self.scaling.function(np.arange(t1, t2, self.t_step)), self.scaling.function(t2))
+            if self.adaptive:
+                ts, points = adaptive_samples(self.function, ts, self.tolerance)
+            else:
+                points = sample_function(self.function, ts)
+            knot_curves.append(np.arange(len(ts)) + (knot_curves[-1][-1] if knot_curves else 0))
+            knot_ts.append(ts)
+            self.start_new_path(points[0])
+            self.add_points_as_corners(points[1:])
+        self.knots = np.concatenate(knot_ts), np.concatenate(knot_curves)
+
+        if self.use_smoothing:
+            self.make_smooth()
+        return self
+
+    init_points = generate_points
+
+    def pointwise_become_partial(self, vmobject, a, b):
+        # a and b come in as shares of the curves. Adaptive corners are unevenly spaced in t, so
+        # read them as shares of t instead, unless the points were changed since (e.g. aligned
+        # for a Transform) and no longer follow the knots.
+        knots = getattr(vmobject, 'knots', None)
+        if getattr(vmobject, 'adaptive', False) and knots is not None and knots[1][-1] == vmobject.get_num_curves():
+            ts, curves = knots
+            a, b = np.interp(ts[0] + np.array([a, b]) * (ts[-1] - ts[0]), ts, curves) / curves[-1]
+        return super().pointwise_become_partial(vmobject, a, b)
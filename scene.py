@@ -1,6 +1,11 @@
 from manim import *
 
-class IntroScene(Scene):
+from geometry_cache import TexCacheMixin
+from mobjects import GlyphDecimalNumber, matrix_factory
+from updaters import DerivedValue, updater_scheduler
+
+
+class IntroScene(TexCacheMixin, Scene):
     def construct(self):
         title = Tex("Can a linear transformation ", "$T: $", "$\\mathbb{R}^2$",
                     "$\\to$", "$\\mathbb{R}^3$", " be onto?", color=WHITE)
@@ -22,7 +27,8 @@ class IntroScene(Scene):
         eq = MathTex(r'f: ', r'\mathbb R^2', r' \to ', r'\mathbb R^3')
         eq.next_to(arw, UP, buff=1)
 
-        out = Matrix([[0.00], [0.00], [0.00]])
+        # Built like the readouts the updater swaps in, so nothing jumps on its first frame
+        out = matrix_factory([[0.00], [0.00], [0.00]])
         out.to_edge(RIGHT, buff=1.5)
 
         dot = Dot().set_color(YELLOW)
@@ -41,10 +47,11 @@ class IntroScene(Scene):
         self.play(FadeIn(fLabel))
         self.wait(0.5)
 
-        out.add_updater(lambda matrix:
-                        out.become(Matrix(self.inclusion(np.around(ax.point_to_coords(dot.get_center()), decimals=1))))
-                        .to_edge(RIGHT, buff=1.5)
-                        )
+        updater_scheduler.add_updater(out, lambda matrix:
+                                      out.become(matrix_factory(
+                                          self.inclusion(np.around(ax.point_to_coords(dot.get_center()), decimals=1))))
+                                      .to_edge(RIGHT, buff=1.5),
+                                      dot.get_center)
 
         trace = ParametricFunction(self.traceScribble, t_range=[0, PI])
         trace.move_to(ax.get_origin())
@@ -66,10 +73,11 @@ class IntroScene(Scene):
         self.wait(0.5)
 
         out.clear_updaters()
-        out.add_updater(lambda matrix:
-                        out.become(Matrix(np.around(self.nonLinear(ax.point_to_coords(dot.get_center())), decimals=1)))
-                        .to_edge(RIGHT, buff=1.5)
-                        )
+        updater_scheduler.add_updater(out, lambda matrix:
+                                      out.become(matrix_factory(
+                                          np.around(self.nonLinear(ax.point_to_coords(dot.get_center())), decimals=1)))
+                                      .to_edge(RIGHT, buff=1.5),
+                                      dot.get_center)
 
         rect2 = SurroundingRectangle(out,color=BLUE)
 
@@ -96,7 +104,7 @@ class IntroScene(Scene):
     def nonLinear(self, v):
         return [[v[0] * v[1]], [v[0] * v[0]], [v[1] * v[1]]]
 
-class Function3DImageScene2(ThreeDScene):
+class Function3DImageScene2(TexCacheMixin, ThreeDScene):
     def construct(self):
 
         axes = ThreeDAxes(
@@ -153,7 +161,7 @@ class Function3DImageScene2(ThreeDScene):
         return np.array([u * v, u * u, v * v])
 
 
-class LinearTransformation(Scene):
+class LinearTransformation(TexCacheMixin, Scene):
     def construct(self):
         title = Tex("Can a ", "linear transformation ", "$T: $", "$\\mathbb{R}^2$",
                     "$\\to$", "$\\mathbb{R}^3$", " be onto?", color=WHITE)
@@ -197,37 +205,41 @@ class LinearTransformation(Scene):
 
         self.play(Write(coordinatePlane), Write(coordinatePlaneLabel))
 
-        coords = Matrix([[0.00], [0.00]])
+        coords = matrix_factory([[0.00], [0.00]], row_colors=(GREEN_C, PINK))
         coords.shift(RIGHT * 3 + UP * 2)
 
         dot = Dot().set_color(YELLOW)
         dot.move_to(coordinatePlane.get_origin())
+        # Input coordinates of the dot, worked out once per frame for all the readouts below
+        dot_coords = DerivedValue(lambda: coordinatePlane.point_to_coords(dot.get_center()), dot.get_center)
 
-        coords.add_updater(lambda matrix:
-                           coords.become(Matrix(
-                               np.around(self.id(coordinatePlane.point_to_coords(dot.get_center())), decimals=1)))
-                           .shift(RIGHT * 3 + UP * 2)
-                           .set_row_colors(GREEN_C, PINK)
-                           )
+        updater_scheduler.add_updater(coords, lambda matrix:
+                                      coords.become(matrix_factory(
+                                          np.around(self.id(dot_coords.get_value()), decimals=1),
+                                          row_colors=(GREEN_C, PINK)))
+                                      .shift(RIGHT * 3 + UP * 2),
+                                      dot_coords)
 
         plus1 = MathTex(r' + ')
         plus1.next_to(coords, DOWN, buff=1.1)
         plus1.shift(RIGHT * 0.3)
 
-        xVec = Matrix([[0.00], [0.00]]).next_to(plus1, LEFT)
-        yVec = Matrix([[0.00], [0.00]]).next_to(plus1, RIGHT)
+        xVec = matrix_factory([[0.00], [0.00]], row_colors=(GREEN_C, WHITE)).next_to(plus1, LEFT)
+        yVec = matrix_factory([[0.00], [0.00]], row_colors=(WHITE, PINK)).next_to(plus1, RIGHT)
 
-        xVec.add_updater(lambda m:
-                         xVec.become(Matrix([[coordinatePlane.p2c(dot.get_center())[0].__round__(1)], [0.00]]))
-                         .next_to(plus1, LEFT)
-                         .set_row_colors(GREEN_C, WHITE)
-                         )
+        updater_scheduler.add_updater(xVec, lambda m:
+                                      xVec.become(matrix_factory(
+                                          [[dot_coords.get_value()[0].__round__(1)], [0.00]],
+                                          row_colors=(GREEN_C, WHITE)))
+                                      .next_to(plus1, LEFT),
+                                      dot_coords)
 
-        yVec.add_updater(lambda m:
-                         yVec.become(Matrix([[0.00], [coordinatePlane.p2c(dot.get_center())[1].__round__(1)]]))
-                         .next_to(plus1, RIGHT)
-                         .set_row_colors(WHITE, PINK)
-                         )
+        updater_scheduler.add_updater(yVec, lambda m:
+                                      yVec.become(matrix_factory(
+                                          [[0.00], [dot_coords.get_value()[1].__round__(1)]],
+                                          row_colors=(WHITE, PINK)))
+                                      .next_to(plus1, RIGHT),
+                                      dot_coords)
 
         equal1 = MathTex(r'= ')
         equal1.next_to(xVec, LEFT, buff=1.3)
@@ -241,23 +253,25 @@ class LinearTransformation(Scene):
         unityVec = Matrix([[0.0], [1.0]])
         unityVec.next_to(plus2, RIGHT, buff=1.2)
 
-        xVal = DecimalNumber(num_decimal_places=1, color=GREEN_C).next_to(unitxVec, LEFT, buff=0.1)
-        xVal.add_updater(lambda x: xVal.set_value(coordinatePlane.p2c(dot.get_center())[0].__round__(1))
-                         .next_to(unitxVec, LEFT, buff=0.1)
-                         )
+        xVal = GlyphDecimalNumber(num_decimal_places=1, color=GREEN_C).next_to(unitxVec, LEFT, buff=0.1)
+        updater_scheduler.add_updater(xVal,
+                                      lambda x: xVal.set_value(dot_coords.get_value()[0].__round__(1))
+                                      .next_to(unitxVec, LEFT, buff=0.1),
+                                      dot_coords)
 
-        yVal = DecimalNumber(num_decimal_places=1, color=PINK).next_to(unityVec, LEFT, buff = 0.1)
-        yVal.add_updater(lambda y: yVal.set_value(coordinatePlane.p2c(dot.get_center())[1].__round__(1))
-                         .next_to(unityVec, LEFT, buff = 0.1)
-                         )
+        yVal = GlyphDecimalNumber(num_decimal_places=1, color=PINK).next_to(unityVec, LEFT, buff = 0.1)
+        updater_scheduler.add_updater(yVal,
+                                      lambda y: yVal.set_value(dot_coords.get_value()[1].__round__(1))
+                                      .next_to(unityVec, LEFT, buff = 0.1),
+                                      dot_coords)
 
         equal2 = MathTex(r'= ')
         equal2.next_to(unitxVec, LEFT, buff=1.3)
 
         lines = coordinatePlane.get_lines_to_point(dot.get_center())
-        lines.add_updater(lambda l:
-                          lines.become(coordinatePlane.get_lines_to_point(dot.get_center()))
-                          )
+        updater_scheduler.add_updater(lines, lambda l:
+                                      lines.become(coordinatePlane.get_lines_to_point(dot.get_center())),
+                                      dot.get_center)
 
         self.play(FadeIn(dot, lines, coords), Write(equal1), Write(xVec), Write(plus1), Write(yVec),
                   Write(equal2), Write(xVal), Write(unitxVec), Write(plus2), Write(yVal), Write(unityVec))
@@ -341,7 +355,7 @@ class LinearTransformation(Scene):
     def id(self, v):
         return [[v[0]], [v[1]]]
 
-class Function3DImageScene3(ThreeDScene):
+class Function3DImageScene3(TexCacheMixin, ThreeDScene):
     def construct(self):
 
         axes = ThreeDAxes(
@@ -386,7 +400,7 @@ class Function3DImageScene3(ThreeDScene):
         return np.array([u + 2 * v, 2 * u, 3 * u - v])
 
 
-class Function3DImageScene4(ThreeDScene):
+class Function3DImageScene4(TexCacheMixin, ThreeDScene):
     def construct(self):
 
         axes = ThreeDAxes(
@@ -418,7 +432,7 @@ class Function3DImageScene4(ThreeDScene):
         self.play(FadeTransform(rect, cube), run_time=1.5)
         self.wait(2)
 
-class Onto(Scene):
+class Onto(TexCacheMixin, Scene):
     def construct(self):
         title = Tex("Can a ", "linear transformation ", "$T: $", "$\\mathbb{R}^2$",
                     "$\\to$", "$\\mathbb{R}^3$", " be ", "onto?", color=WHITE)
@@ -435,7 +449,7 @@ class Onto(Scene):
         self.play(Write(defOnto))
         self.wait(2)
 
-class Thumbnail(Scene):
+class Thumbnail(TexCacheMixin, Scene):
     def construct(self):
         title = Tex('Quality Math Visuals')
         title.center()
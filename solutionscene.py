@@ -1,6 +1,12 @@
 from manim import *
 
-class IntroScene(Scene):
+from animations import TrajectoryAnimation
+from geometry_cache import TexCacheMixin
+from mobjects import BoundedTracedPath, CulledScroll, RetargetableArrow3D
+from updaters import updater_scheduler
+
+
+class IntroScene(TexCacheMixin, Scene):
     def construct(self):
         title = Tex("Can a ", "linear transformation ", "$T: $", "$\\mathbb{R}^2$",
                 "$\\to$", "$\\mathbb{R}^3$", " be ", "onto?", color=WHITE)
@@ -55,7 +61,7 @@ class IntroScene(Scene):
 
         self.play(TransformMatchingTex(assigns, colmVecs))
 
-class SeeSpanIllistration(ThreeDScene):
+class SeeSpanIllistration(TexCacheMixin, ThreeDScene):
     def construct(self):
         self.set_camera_orientation(phi=70*DEGREES, theta = 0 * DEGREES)
         self.begin_ambient_camera_rotation(0.15)
@@ -89,8 +95,8 @@ class SeeSpanIllistration(ThreeDScene):
 
         newV2 = Arrow3D(start=dots[0].get_center(), end=(dots[1].get_center() + dots[0].get_center()), color=GREEN)
 
-        v1 = Arrow3D(start=axes.get_origin(), end=dots[0].get_center(), color=PINK)
-        v2 = Arrow3D(start=axes.get_origin(), end=dots[1].get_center(), color=GREEN, target=newV2.copy())
+        v1 = RetargetableArrow3D(start=axes.get_origin(), end=dots[0].get_center(), color=PINK)
+        v2 = RetargetableArrow3D(start=axes.get_origin(), end=dots[1].get_center(), color=GREEN, target=newV2.copy())
 
         self.play(FadeIn(v1), FadeIn(v2))
         self.play(FadeOut(dots))
@@ -100,41 +106,41 @@ class SeeSpanIllistration(ThreeDScene):
         tip = Dot3D(dots[1].get_center() + dots[0].get_center(), color=BLUE)
         self.play(FadeIn(tip))
 
-        path = TracedPath(tip.get_center)
+        # The tip is placed from SeeSpan's trajectory table each frame, and the path follows it,
+        # keeping only the corners it needs
+        path = BoundedTracedPath(tip.get_center)
         self.add(path)
 
-        #Animation takes long time
-        self.play(SeeSpan(v1, v2, tip), run_time=10)
+        self.play(SeeSpan(v1, v2, tip, run_time=10))
         self.wait(2)
 
 
-class SeeSpan(Animation):
-    def __init__(self, v1: Arrow3D, v2: Arrow3D, tip: Dot3D, **kwargs):
-        super().__init__(VGroup(v1, v2), **kwargs)
+class SeeSpan(TrajectoryAnimation):
+    def __init__(self, v1: RetargetableArrow3D, v2: RetargetableArrow3D, tip: Dot3D, rate_func=linear, **kwargs):
+        super().__init__(VGroup(v1, v2), rate_func=rate_func, **kwargs)
         self.v1 = v1
         self.v2 = v2
         self.v1Orig = np.copy(v1.get_end())
         self.v2Orig = np.copy(v2.get_end())
         self.tip = tip
 
-    def interpolate_mobject(self, alpha: float) -> None:
-        newEnd1 = self.v1Mag(alpha) * self.v1Orig
-        self.v1.become(Arrow3D(self.v1.get_start(), newEnd1, color=PINK))
+    def trajectory(self, alphas):
+        newEnd1 = self.v1Mag(alphas)[:, None] * self.v1Orig
+        newEnd2 = self.v2Mag(alphas)[:, None] * self.v2Orig
+        return {'end1': newEnd1, 'tip': newEnd1 + newEnd2}
 
-        newEnd2 = self.v2Mag(alpha) * self.v2Orig
-        self.v2.become(Arrow3D(newEnd1, newEnd1 + newEnd2, color=GREEN))
-        self.tip.move_to(newEnd2 + newEnd1)
+    def apply_trajectory(self, points):
+        self.v1.put_start_and_end_on(self.v1.get_start(), points['end1'])
+        self.v2.put_start_and_end_on(points['end1'], points['tip'])
+        self.tip.move_to(points['tip'])
 
     def v1Mag(self, t):
-        x = 1 - 4 * t
-        if t > 0.5:
-            return 4 * t - 3
-        return x
+        return np.where(t > 0.5, 4 * t - 3, 1 - 4 * t)
 
     def v2Mag(self, t):
         return np.cos(4 * PI * t)
 
-class SeeTransformation(ThreeDScene):
+class SeeTransformation(TexCacheMixin, ThreeDScene):
     def construct(self):
 
         axes = ThreeDAxes(
@@ -187,8 +193,9 @@ class SeeTransformation(ThreeDScene):
         self.play(Write(note))
 
         newW2 = Arrow3D(start=axes.c2p([[1], [2], [3]]), end=axes.c2p([[3], [2], [2]]), color=GREEN).set_z_index(1)
-        w1 = Arrow3D(start=axes.get_origin(), end=axes.c2p([[1], [2], [3]]), color=PINK).set_z_index(1)
-        w2 = Arrow3D(start=axes.get_origin(), end=axes.c2p([[2], [0], [-1]]), color=GREEN, target=newW2).set_z_index(1)
+        w1 = RetargetableArrow3D(start=axes.get_origin(), end=axes.c2p([[1], [2], [3]]), color=PINK).set_z_index(1)
+        w2 = RetargetableArrow3D(start=axes.get_origin(), end=axes.c2p([[2], [0], [-1]]), color=GREEN,
+                                 target=newW2).set_z_index(1)
         self.remove(v1, v2)
         self.add(w1, w2)
 
@@ -198,7 +205,6 @@ class SeeTransformation(ThreeDScene):
 
         self.play(FadeIn(tip), run_time=0.5)
 
-        # Animation takes long time
         self.play(SeeSpan(w1, w2, tip), run_time=6, rate_func=linear)
 
         final = Tex(r'Image$(T) = $', r'span',
@@ -224,7 +230,7 @@ class SeeTransformation(ThreeDScene):
     def surf(self, u, v):
         return np.array([u + 2 * v, 2 * u, 3 * u - v])
 
-class DifferentCasesScene(ThreeDScene):
+class DifferentCasesScene(TexCacheMixin, ThreeDScene):
     def construct(self):
 
         transitionEq = MathTex("\\textrm{span} \\left ( T \\left ( \\begin{bmatrix} 1\\\\0 \\end{bmatrix} \\right ), T \\left ( \\begin{bmatrix} 0\\\\1 \\end{bmatrix} \\right ) \\right )", color=BLUE_B)
@@ -367,7 +373,7 @@ class DifferentCasesScene(ThreeDScene):
         t = u + v
         return np.array([t, 2 * t, 3 * t])
 
-class CubeExample(ThreeDScene):
+class CubeExample(TexCacheMixin, ThreeDScene):
     def construct(self):
 
         axes = ThreeDAxes(
@@ -395,7 +401,7 @@ class CubeExample(ThreeDScene):
         self.play(FadeTransform(rect, cube))
         self.wait(3)
 
-class TransitionScene(Scene):
+class TransitionScene(TexCacheMixin, Scene):
     def construct(self):
         title = Tex("Can a", " linear transformation ", "$T: $", "$\\mathbb{R}^2$",
                 "$\\to$", "$\\mathbb{R}^3$", " be onto?", color=WHITE)
@@ -440,7 +446,7 @@ class TransitionScene(Scene):
         self.play(TransformMatchingTex(gp, gp2))
         self.wait(1)
 
-class SpanAll3DSpace(ThreeDScene):
+class SpanAll3DSpace(TexCacheMixin, ThreeDScene):
     def construct(self):
         axes = ThreeDAxes(
             x_range=[-2, 2, 1],
@@ -458,14 +464,16 @@ class SpanAll3DSpace(ThreeDScene):
 
         self.play(Write(axes), run_time=0.5)
 
-        i = Arrow3D(start=axes.get_origin(), end=axes.c2p([[1], [0], [0]]),
-                    color=PINK)
-        j = Arrow3D(start=axes.get_origin(), end=axes.c2p([[0], [1], [0]]),
-                    target=Arrow3D(start=axes.c2p([[1], [0], [0]]), end=axes.c2p([[1], [1], [0]]), color=GREEN),
-                    color=GREEN)
-        k = Arrow3D(start=axes.get_origin(), end=axes.c2p([[0], [0], [1]]),
-                    target=Arrow3D(start=axes.c2p([[1], [1], [0]]), end=axes.c2p([[1], [1], [1]]), color=YELLOW),
-                    color=YELLOW)
+        i = RetargetableArrow3D(start=axes.get_origin(), end=axes.c2p([[1], [0], [0]]),
+                                color=PINK)
+        j = RetargetableArrow3D(start=axes.get_origin(), end=axes.c2p([[0], [1], [0]]),
+                                target=Arrow3D(start=axes.c2p([[1], [0], [0]]), end=axes.c2p([[1], [1], [0]]),
+                                               color=GREEN),
+                                color=GREEN)
+        k = RetargetableArrow3D(start=axes.get_origin(), end=axes.c2p([[0], [0], [1]]),
+                                target=Arrow3D(start=axes.c2p([[1], [1], [0]]), end=axes.c2p([[1], [1], [1]]),
+                                               color=YELLOW),
+                                color=YELLOW)
         gp = VGroup(i, j, k)
         self.play(FadeIn(gp))
         self.play(MoveToTarget(j), MoveToTarget(k))
@@ -476,7 +484,7 @@ class SpanAll3DSpace(ThreeDScene):
         self.play(SeeSpan3D(i, j, k, tip), run_time=8)
         self.wait(2)
 
-class ExpansionScene(Scene):
+class ExpansionScene(TexCacheMixin, Scene):
     def construct(self):
         r3transformation = Tex(r'$T: \mathbb R^3 \to \mathbb R^3$').shift(UP)
 
@@ -553,15 +561,21 @@ class ExpansionScene(Scene):
         self.play(Write(check3))
         self.wait(6)
 
-class ScrollingVectorScene(Scene):
+class ScrollingVectorScene(TexCacheMixin, Scene):
     def construct(self):
         vector = MathTex("\\begin{bmatrix} 1\\\\4\\\\4\\\\6\\\\5\\\\2\\\\1\\\\0\\\\9\\\\7\\\\3\\\\1\\\\4\\\\2\\\\6\\\\9\\\\8\\\\0\\\\7\\\\0\\\\7\\\\3\\\\6\\\\9\\\\1\\\\4\\\\4\\\\6\\\\5\\\\2\\\\1\\\\0\\\\9\\\\7\\\\3\\\\1\\\\4\\\\2\\\\6\\\\9\\\\8\\\\0\\\\7\\\\0\\\\7\\\\3\\\\6\\\\9\\\\1\\\\4\\\\4\\\\6\\\\5\\\\2\\\\1\\\\0\\\\9\\\\7\\\\3\\\\1\\\\4\\\\2\\\\6\\\\9\\\\8\\\\0\\\\7\\\\0\\\\7\\\\3\\\\6\\\\9\\\\4\\\\4\\\\6\\\\5\\\\2\\\\1\\\\0\\\\9\\\\7\\\\3\\\\1\\\\4\\\\2\\\\6\\\\9\\\\8\\\\0\\\\7\\\\0\\\\7\\\\3\\\\6\\\\9\\\\1\\\\4\\\\4\\\\6\\\\5\\\\2\\\\1\\\\0\\\\9\\\\7\\\\3\\\\1\\\\4\\\\2\\\\6\\\\9\\\\8\\\\0\\\\7\\\\0\\\\7\\\\3\\\\6\\\\9\\\\1\\\\4\\\\4\\\\6\\\\5\\\\2\\\\1\\\\0\\\\9\\\\7\\\\3\\\\1\\\\4\\\\2\\\\6\\\\9\\\\8\\\\0\\\\7\\\\0\\\\7\\\\3\\\\6\\\\9\\\\4\\\\4\\\\6\\\\5\\\\2\\\\1\\\\0\\\\9\\\\7\\\\3\\\\1\\\\4\\\\2\\\\6\\\\9\\\\8\\\\0\\\\7\\\\0\\\\7\\\\3\\\\6\\\\9\\\\1\\\\4\\\\4\\\\6\\\\5\\\\2\\\\1\\\\0\\\\9\\\\7\\\\3\\\\1\\\\4\\\\2\\\\6\\\\9\\\\8\\\\0\\\\7\\\\0\\\\7\\\\3\\\\6\\\\9\\\\1\\\\4\\\\4\\\\6\\\\5\\\\2\\\\1\\\\0\\\\9\\\\7\\\\3\\\\1\\\\4\\\\2\\\\6\\\\9\\\\8\\\\0\\\\7\\\\0\\\\7\\\\3\\\\6\\\\9 \\end{bmatrix}", font_size=96)
         vector.to_edge(UP)
+        # Distance vector.to_edge(DOWN) would move it, covered by scrolling only what's on screen
+        scroll = vector.copy().to_edge(DOWN).get_center() - vector.get_center()
+        vector = CulledScroll(vector)
+
+        progress = ValueTracker(0)
+        updater_scheduler.add_updater(vector, lambda m: m.scroll_to(progress.get_value() * scroll), progress)
         self.add(vector)
-        self.play(vector.animate.to_edge(DOWN), run_time=12)
+        self.play(progress.animate.set_value(1), run_time=12)
         self.wait(2)
 
-class MatrixExampleScene(Scene):
+class MatrixExampleScene(TexCacheMixin, Scene):
     def construct(self):
         assign1 = MathTex(r'T\left ( \begin{bmatrix} 1 \\ 0 \end{bmatrix} \right ) =', r'\begin{bmatrix} 1 \\ 2 \\ 3 \end{bmatrix}')
         assign2 = MathTex(r'T\left ( \begin{bmatrix} 0 \\ 1 \end{bmatrix} \right ) =', r'\begin{bmatrix} 2 \\ 0 \\ -1 \end{bmatrix}')
@@ -626,9 +640,10 @@ class MatrixExampleScene(Scene):
         self.play(FadeOut(mtrxBij, shift= DOWN))
 
 
-class SeeSpan3D(Animation):
-    def __init__(self, v1: Arrow3D, v2: Arrow3D, v3: Arrow3D, tip: Dot3D, **kwargs):
-        super().__init__(VGroup(v1, v2), **kwargs)
+class SeeSpan3D(TrajectoryAnimation):
+    def __init__(self, v1: RetargetableArrow3D, v2: RetargetableArrow3D, v3: RetargetableArrow3D, tip: Dot3D,
+                 rate_func=linear, **kwargs):
+        super().__init__(VGroup(v1, v2), rate_func=rate_func, **kwargs)
         self.v1 = v1
         self.v2 = v2
         self.v3 = v3
@@ -637,22 +652,20 @@ class SeeSpan3D(Animation):
         self.v3Orig = np.copy(v3.get_end())
         self.tip = tip
 
-    def interpolate_mobject(self, alpha: float) -> None:
-        newEnd1 = self.v1Mag(alpha) * self.v1Orig
-        self.v1.become(Arrow3D(self.v1.get_start(), newEnd1, color=PINK))
-
-        newEnd2 = self.v2Mag(alpha) * self.v2Orig
-        self.v2.become(Arrow3D(newEnd1, newEnd1 + newEnd2, color=GREEN))
+    def trajectory(self, alphas):
+        newEnd1 = self.v1Mag(alphas)[:, None] * self.v1Orig
+        newEnd2 = self.v2Mag(alphas)[:, None] * self.v2Orig
+        newEnd3 = self.v3Mag(alphas)[:, None] * self.v3Orig
+        return {'end1': newEnd1, 'end2': newEnd1 + newEnd2, 'tip': newEnd1 + newEnd2 + newEnd3}
 
-        newEnd3 = self.v3Mag(alpha) * self.v3Orig
-        self.v3.become(Arrow3D(newEnd1 + newEnd2, newEnd1 + newEnd2 + newEnd3, color=YELLOW))
-        self.tip.move_to(newEnd1 + newEnd2 + newEnd3)
+    def apply_trajectory(self, points):
+        self.v1.put_start_and_end_on(self.v1.get_start(), points['end1'])
+        self.v2.put_start_and_end_on(points['end1'], points['end2'])
+        self.v3.put_start_and_end_on(points['end2'], points['tip'])
+        self.tip.move_to(points['tip'])
 
     def v1Mag(self, t):
-        x = 1 - 4 * t
-        if t > 0.5:
-            return 4 * t - 3
-        return x
+        return np.where(t > 0.5, 4 * t - 3, 1 - 4 * t)
 
     def v2Mag(self, t):
         return np.cos(4 * PI * t)
@@ -660,7 +673,7 @@ class SeeSpan3D(Animation):
     def v3Mag(self, t):
         return np.cos(2 * PI * t)
 
-class FinalScene(Scene):
+class FinalScene(TexCacheMixin, Scene):
     def construct(self):
         title = Tex("Can a ", "linear transformation ", "$T: $", "$\\mathbb{R}^2$",
                     "$\\to$", "$\\mathbb{R}^3$", " be ", "onto?", color=WHITE).shift(UP)
@@ -686,7 +699,7 @@ class FinalScene(Scene):
         self.play(Write(thanks))
         self.wait(4)
 
-class YouAskScene(Scene):
+class YouAskScene(TexCacheMixin, Scene):
     def construct(self):
         label = Text("You")
         Q1 = Text("?", font_size=48).rotate(45 * DEGREES).shift(UP * 2 + RIGHT)
@@ -699,7 +712,7 @@ class YouAskScene(Scene):
         self.play(Write(Q3))
         self.wait()
 
-class UsedInScene(Scene):
+class UsedInScene(TexCacheMixin, Scene):
     def construct(self):
         cs = Tex('Computer Science').shift(UP * 2 + LEFT * 3)
         ml = Tex('Machine Learning').shift(UP * 2 + RIGHT * 3)
@@ -710,7 +723,7 @@ class UsedInScene(Scene):
         self.play(Write(cm), run_time = 0.85)
         self.play(Write(cp), run_time = 0.85)
         self.wait(2.5)
-class Thumbnail(Scene):
+class Thumbnail(TexCacheMixin, Scene):
     def construct(self):
         one = Tex(r'Image of $T: \mathbb R^2 \to \mathbb R^3$', color=BLUE_B).to_edge(DOWN, buff=1)
         self.add(one)
@@ -0,0 +1,172 @@
+import os
+import re
+import subprocess
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from manim import *
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import compile_tex, generate_tex_file, tex_hash, tex_to_svg_file
+
+# Stand-in for every svg that isn't compiled yet during a dry run. It needs a glyph: MathTex
+# splits itself into parts by slicing its submobjects, which fails on an empty svg.
+PLACEHOLDER_SVG = '<svg xmlns="http://www.w3.org/2000/svg" version="1.1" viewBox="0 0 10 10">' \
+                  '<path d="M 0 0 L 10 0 L 10 10 L 0 10 Z"/></svg>\n'
+BATCH_DOCUMENTCLASS = '\\documentclass{article}\n\\usepackage[active,tightpage]{preview}'
+
+
+def svg_path(expression, environment, tex_template):
+    # Where tex_to_svg_file looks for (and leaves) the svg of this expression
+    return generate_tex_file(expression, environment, tex_template).with_suffix('.svg')
+
+
+def record_tex(build):
+    # Calls build() once with every missing svg replaced by a placeholder, so no LaTeX runs,
+    # and returns the (expression, environment, tex_template) of each of them. Substrings
+    # MathTex typesets on its own to split itself up are recorded along with the rest.
+    # The dry run is only a way to find strings. With a single placeholder glyph, indexing into
+    # a Tex (tex[0][3]) raises IndexError, and measuring a part of it left without points
+    # (tex[1].get_center()) raises ValueError. Either ends the run early, returning whatever was
+    # recorded up to then, and the rest compiles as usual. Anything else is a real error.
+    placeholder = config.get_dir('tex_dir') / 'placeholder.svg'
+    placeholder.parent.mkdir(parents=True, exist_ok=True)
+    if not placeholder.exists() or placeholder.read_text() != PLACEHOLDER_SVG:
+        placeholder.write_text(PLACEHOLDER_SVG)
+
+    jobs = []
+
+    def record(expression, environment=None, tex_template=None):
+        tex_template = tex_template or config['tex_template']
+        if svg_path(expression, environment, tex_template).exists():
+            return tex_to_svg_file(expression, environment, tex_template)
+        jobs.append((expression, environment, tex_template))
+        return placeholder
+
+    tex_mobject.tex_to_svg_file = record
+    try:
+        build()
+    except (IndexError, ValueError) as error:
+        logger.warning('Tex dry run stopped early (%r), %d strings recorded', error, len(jobs))
+    finally:
+        tex_mobject.tex_to_svg_file = tex_to_svg_file
+    return jobs
+
+
+def unique_jobs(jobs):
+    # Repeated strings only need typesetting once
+    unique = {}
+    for expression, environment, tex_template in jobs:
+        unique.setdefault((expression, environment, tex_template.body), (expression, environment, tex_template))
+    return list(unique.values())
+
+
+def batch_document(jobs):
+    # One page per job, all sharing the preamble of the first job's template. Each page is a
+    # preview environment, cropped like the standalone class crops a single expression.
+    pages = []
+    for expression, environment, tex_template in jobs:
+        if environment is not None:
+            document = tex_template.get_texcode_for_expression_in_env(expression, environment)
+        else:
+            document = tex_template.get_texcode_for_expression(expression)
+        start = document.index('\\begin{document}') + len('\\begin{document}')
+        pages.append('\\begin{preview}\n' + document[start:document.rindex('\\end{document}')] + '\\end{preview}\n')
+
+    template = jobs[0][2]
+    return BATCH_DOCUMENTCLASS + '\n' + template.preamble + '\n\\begin{document}\n' + ''.join(pages) + \
+        '\\end{document}\n'
+
+
+def compile_batch(jobs):
+    # Typesets jobs (all with the same template) with one LaTeX and one dvisvgm run, and puts
+    # each page where tex_to_svg_file would have written that expression's svg.
+    tex_template = jobs[0][2]
+    tex_dir = config.get_dir('tex_dir')
+    document = batch_document(jobs)
+    tex_file = tex_dir / ('batch_' + tex_hash(document) + '.tex')
+    tex_file.write_text(document, encoding='utf-8')
+    dvi_file = compile_tex(tex_file, tex_template.tex_compiler, tex_template.output_format)
+
+    prefix = dvi_file.stem + '-'
+    subprocess.run(['dvisvgm', *(['--pdf'] if tex_template.output_format == '.pdf' else []), '--page=1-', '-n',
+                    '-v', '0', '-o', str(tex_dir / (prefix + '%p.svg')), str(dvi_file)],
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    # dvisvgm pads page numbers to the width of the last one, so match them up by value
+    page_files = {}
+    for name in os.listdir(tex_dir):
+        match = re.fullmatch(re.escape(prefix) + r'(\d+)\.svg', name)
+        if match:
+            page_files[int(match[1])] = tex_dir / name
+    for page, (expression, environment, _) in enumerate(jobs, start=1):
+        if page not in page_files:
+            continue
+        target = svg_path(expression, environment, tex_template)
+        os.replace(page_files[page], target)
+        # tex_to_svg_file only checks the compiler output exists before reusing the svg next to it
+        target.with_suffix(tex_template.output_format).touch()
+
+
+def batch_tex(build):
+    # Returns build(), after compiling every Tex and MathTex it makes that isn't typeset yet
+    # in one LaTeX run per template, instead of one latex + dvisvgm pair per string.
+    # build runs twice, the first time against placeholder svgs, so it should only construct
+    # mobjects. Templates with their own documentclass, and any batch LaTeX rejects, are
+    # left for manim to compile one by one, which also gives the usual error report.
+    groups = defaultdict(list)
+    for job in record_tex(build):
+        tex_template = job[2]
+        if tex_template.documentclass == TexTemplate.default_documentclass:
+            groups[(tex_template.tex_compiler, tex_template.output_format, tex_template.body)].append(job)
+
+    for jobs in groups.values():
+        jobs = unique_jobs(jobs)
+        try:
+            compile_batch(jobs)
+        except ValueError:
+            logger.warning('Batch LaTeX run failed, compiling its %d strings one at a time', len(jobs))
+
+    return build()
+
+
+# LaTeX and dvisvgm run as subprocesses, so threads are enough to keep every core busy
+tex_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+# Compiles already handed to tex_pool, so two futures sharing a string don't both write its files
+tex_compiles = {}
+
+
+def compile_in_background(job):
+    expression, environment, tex_template = job
+    key = (expression, environment, tex_template.body)
+    if key not in tex_compiles:
+        tex_compiles[key] = tex_pool.submit(tex_to_svg_file, *job)
+    return tex_compiles[key]
+
+
+class TexFuture:
+    """Tex and MathTex mobjects whose LaTeX runs in the background.
+
+    Creating one records which strings build() typesets (see record_tex) and hands each
+    missing one to tex_pool, so they compile side by side while construct() carries on,
+    typically playing the animations before the ones that need them. result() waits for
+    them and then calls build() for real, on the calling thread, since mobjects aren't safe
+    to build elsewhere. The mobjects don't exist until then, so create the future as early
+    as possible and call result() as late as possible. Compile errors come out of result().
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.compiles = [compile_in_background(job) for job in unique_jobs(record_tex(build))]
+        self.value = None
+        self.built = False
+
+    def done(self):
+        return all(job.done() for job in self.compiles)
+
+    def result(self):
+        if not self.built:
+            for job in self.compiles:
+                job.result()
+            self.value = self.build()
+            self.built = True
+        return self.value
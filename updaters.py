@@ -0,0 +1,172 @@
+from manim import *
+
+from parametric import refine_samples
+
+
+def style_updater(tracker, stroke_width=None, stroke_opacity=None, stroke_color=None):
+    # Updater that restyles a mobject in place from tracker's value, for curves that were only
+    # wrapped in always_redraw so their style could follow a ValueTracker. Each style argument
+    # is a function of the tracker value. Points are never touched, and nothing happens on
+    # frames where the value hasn't moved.
+    last_value = [None]
+
+    def update(mob):
+        value = tracker.get_value()
+        if value == last_value[0]:
+            return
+        last_value[0] = value
+        mob.set_stroke(
+            color=None if stroke_color is None else stroke_color(value),
+            width=None if stroke_width is None else stroke_width(value),
+            opacity=None if stroke_opacity is None else stroke_opacity(value),
+        )
+
+    return update
+
+
+def bind_style(mobject, tracker, **styles):
+    # mobject with a style_updater attached, so it can be used in place of always_redraw(...)
+    return mobject.add_updater(style_updater(tracker, **styles), call_updater=True)
+
+
+def position_updater(tracker, func, t_range=(0, 1), samples=1025, tolerance=0.001):
+    # Updater that moves a mobject to func(tracker value) without calling func per frame.
+    # func is sampled once over t_range, starting from samples evenly spaced t and refined
+    # where the curve bends (see refine_samples), and each frame interpolates that table,
+    # so anything func depends on has to stay put while bound. tolerance bounds how far the
+    # interpolated point lands from func(t) at the middle of each table interval.
+    ts, points = refine_samples(func, np.linspace(t_range[0], t_range[1], samples), tolerance)
+    last_value = [None]
+
+    def update(mob):
+        value = tracker.get_value()
+        if value == last_value[0]:
+            return
+        last_value[0] = value
+        t = np.clip(value, ts[0], ts[-1])
+        i = np.clip(np.searchsorted(ts, t), 1, len(ts) - 1)
+        alpha = (t - ts[i - 1]) / (ts[i] - ts[i - 1])
+        mob.shift(points[i - 1] + alpha * (points[i] - points[i - 1]) - mob.get_center())
+
+    return update
+
+
+def bind_position(mobject, tracker, func, t_range=(0, 1), **kwargs):
+    # mobject with a position_updater attached, in place of always_redraw(lambda: Dot(func(t)))
+    return mobject.add_updater(position_updater(tracker, func, t_range, **kwargs), call_updater=True)
+
+
+def scale_updater(mobject, tracker, scale, about_point=ORIGIN):
+    # Updater scaling mobject's family by scale(tracker value) about about_point. The points
+    # mobject has now are cached as the unscaled geometry, and each frame writes
+    # about_point + offsets * scale into the existing arrays, so nothing is rebuilt.
+    # Stroke widths are left alone, same as with Mobject.scale.
+    about_point = np.array(about_point, dtype=float)
+    cached = [(mob, mob.points - about_point) for mob in mobject.family_members_with_points()]
+    last_value = [None]
+
+    def update(mob):
+        value = tracker.get_value()
+        if value == last_value[0]:
+            return
+        last_value[0] = value
+        factor = scale(value)
+        for member, offsets in cached:
+            if member.points.shape == offsets.shape:
+                np.multiply(offsets, factor, out=member.points)
+                member.points += about_point
+            else:
+                member.points = about_point + offsets * factor
+
+    return update
+
+
+def bind_scale(mobject, tracker, scale, about_point=ORIGIN):
+    # mobject with a scale_updater attached, in place of always_redraw(lambda: Mobject(...).scale(...))
+    return mobject.add_updater(scale_updater(mobject, tracker, scale, about_point), call_updater=True)
+
+
+def dependency_state(dependency):
+    # Something that compares equal on two frames exactly when dependency hasn't changed in between.
+    # Mobjects are watched through a probe, a function like dot.get_center or curve.get_end called
+    # with no arguments, that reads only what the updater reads: comparing all of a mobject's
+    # points every frame would cost more than most of the updaters it is meant to skip.
+    if isinstance(dependency, ValueTracker):
+        return dependency.get_value()
+    if isinstance(dependency, DerivedValue):
+        return np.asarray(dependency.get_value()).tobytes()
+    if isinstance(dependency, Mobject):
+        raise TypeError('Depend on a probe of {} (e.g. its get_center), not the mobject itself'
+                        .format(type(dependency).__name__))
+    return np.asarray(dependency()).tobytes()
+
+
+class DerivedValue:
+    """A value computed from trackers and mobject probes, shared by every updater that needs it.
+
+    get_value only calls func again when one of the dependencies has changed since the last
+    call, so any number of updaters can read it on the same frame for the price of one
+    evaluation. It can itself be a dependency for the scheduler or another DerivedValue,
+    and counts as changed when its value does. computed counts the calls to func.
+    """
+
+    def __init__(self, func, *dependencies):
+        self.func = func
+        self.dependencies = dependencies
+        self.states = None
+        self.value = None
+        self.computed = 0
+
+    def get_value(self):
+        states = [dependency_state(dependency) for dependency in self.dependencies]
+        if states != self.states:
+            self.states = states
+            self.value = self.func()
+            self.computed += 1
+        return self.value
+
+
+class UpdaterScheduler:
+    """Runs updaters only on frames where something they read has changed.
+
+    Every updater is registered along with the trackers, derived values and probes it
+    depends on. Each counts as changed when its value does, a probe being called for its
+    value (see dependency_state). executed and skipped count the calls that ran and the
+    ones that didn't.
+    """
+
+    def __init__(self):
+        self.executed = 0
+        self.skipped = 0
+
+    def reset_counters(self):
+        self.executed = 0
+        self.skipped = 0
+
+    def state(self, dependency):
+        return dependency_state(dependency)
+
+    def wrap(self, updater, *dependencies):
+        last_states = [None]
+
+        def update(mob):
+            states = [self.state(dependency) for dependency in dependencies]
+            if states == last_states[0]:
+                self.skipped += 1
+                return
+            last_states[0] = states
+            self.executed += 1
+            updater(mob)
+
+        return update
+
+    def add_updater(self, mobject, updater, *dependencies):
+        return mobject.add_updater(self.wrap(updater, *dependencies))
+
+    def redraw(self, func, *dependencies):
+        # always_redraw(func), rebuilding only when a dependency has changed
+        mob = func()
+        return self.add_updater(mob, lambda m: m.become(func()), *dependencies)
+
+
+updater_scheduler = UpdaterScheduler()